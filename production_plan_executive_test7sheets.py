@@ -14,19 +14,54 @@ FIXED: Now shows ALL 8 stages in Executive Dashboard + Daily Schedules
 - Part-Level Daily Schedule (detailed part-by-part production with machine assignments)
 
 Usage:
-    python production_planning_executive_test7sheets.py
+    python production_planning_executive_test7sheets.py [--force]
 """
 
 import pandas as pd
+import argparse
+import os
+import re
+import sys
 import numpy as np
-from openpyxl import load_workbook
+from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import holidays
 
 
+# Priority → status icon used by alert and capacity sheets
+STATUS_ICONS = {'CRITICAL': '🔴', 'WARNING': '🟡', 'HEALTHY': '🟢'}
+
+# Status patterns per level (critical, warning, good); the first matching level wins
+DASHBOARD_STATUS_PATTERNS = (
+    re.compile('🔴|CRITICAL', re.IGNORECASE),
+    re.compile('🟡|WARNING', re.IGNORECASE),
+    re.compile('🟢|GOOD|✓|HEALTHY', re.IGNORECASE)
+)
+STANDARD_STATUS_PATTERNS = (
+    re.compile('🔴|CRITICAL', re.IGNORECASE),
+    re.compile('🟡|WARNING|⚠', re.IGNORECASE),
+    re.compile('🟢|✓', re.IGNORECASE)
+)
+DAILY_STATUS_PATTERNS = (
+    re.compile('🔴|HOLIDAY', re.IGNORECASE),
+    re.compile('🟡|SATURDAY', re.IGNORECASE),
+    re.compile('🟢|WORKING', re.IGNORECASE)
+)
+
+# Part-daily separator rows: any red/yellow marker, or a parenthesised label without a green marker
+SEPARATOR_PATTERN = re.compile(r'[🔴🟡]|^(?!.*🟢).*\(.*\)', re.DOTALL)
+
+# Shared blank spacer rows for the schedule sheets (one per sheet width)
+BLANK_ROW_12 = ('',) * 12
+BLANK_ROW_13 = ('',) * 13
+BLANK_ROW_14 = ('',) * 14
+BLANK_ROW_17 = ('',) * 17
+
+
 class ProductionCalendar:
     """Manages production calendar with Indian holidays for ship date distribution"""
 
@@ -486,10 +521,12 @@ class FixedExecutiveReportGenerator:
         self.detailed_path = detailed_output_path
         self.wb = None
         self.weeks = []
+        self._weeks_set = frozenset()
         self.num_weeks = 0
         self.start_date = start_date if start_date else datetime(2025, 10, 16)
         self.master_data_path = master_data_path
         self.enricher = None
+        self._changeover_summary = None
 
         # Initialize production calendar for working day calculations
         self.calendar = ProductionCalendar(self.start_date)
@@ -515,8 +552,15 @@ class FixedExecutiveReportGenerator:
             'light_gray': 'F8F9FA',
             'white': 'FFFFFF',
             'yellow_light': 'FFF9E6',
-            'border_gray': 'DEE2E6'
+            'border_gray': 'DEE2E6',
+            'holiday': 'FFCCCC',
+            'saturday': 'FFF9CC',
+            'working_day': 'E8F5E9',
+            'separator': 'E7E6E6',
+            'tracker_subheader': '366092'
         }
+        # Store every color as the 8-char ARGB value openpyxl would expand it to
+        self.colors = {name: self._argb(color) for name, color in self.colors.items()}
         
         # Fonts
         self.fonts = {
@@ -526,7 +570,26 @@ class FixedExecutiveReportGenerator:
             'normal': Font(name='Calibri', size=10, color='000000'),
             'small': Font(name='Calibri', size=9, color='666666'),
             'metric': Font(name='Calibri', size=14, bold=True, color='1F4788'),
-            'metric_value': Font(name='Calibri', size=18, bold=True, color='1F4788')
+            'metric_value': Font(name='Calibri', size=18, bold=True, color='1F4788'),
+            'subtitle': Font(name='Calibri', size=10, italic=True, color='666666')
+        }
+
+        # Shared style objects keyed by their arguments (see _fill/_font)
+        self._fill_cache = {}
+        self._font_cache = {}
+
+        # Progress lines from generate_executive_report, written out in batches
+        self._log_buf = []
+
+        # Solid fills for every palette color, shared by all formatters
+        self.fills = {name: self._fill(color) for name, color in self.colors.items()}
+
+        # Alignments
+        self.alignments = {
+            'left': Alignment(horizontal='left', vertical='center'),
+            'center': Alignment(horizontal='center', vertical='center'),
+            'right': Alignment(horizontal='right', vertical='center'),
+            'center_wrap': Alignment(horizontal='center', vertical='center', wrap_text=True)
         }
         
         # Initialize with default capacity limits (will be updated after loading data)
@@ -541,6 +604,27 @@ class FixedExecutiveReportGenerator:
             'SP3_Units': 500,
         }
 
+    @staticmethod
+    def _argb(color):
+        """Expand a 6-char RGB hex color to openpyxl's 8-char ARGB form (8-char values pass through)"""
+        return color if len(color) == 8 else '00' + color
+
+    def _fill(self, color):
+        """Return the shared solid PatternFill for a hex color"""
+        color = self._argb(color)
+        fill = self._fill_cache.get(color)
+        if fill is None:
+            fill = self._fill_cache[color] = PatternFill(start_color=color, end_color=color, fill_type='solid')
+        return fill
+
+    def _font(self, **kwargs):
+        """Return the shared Font for a set of Font keyword arguments"""
+        key = tuple(sorted(kwargs.items()))
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = Font(**kwargs)
+        return font
+
     def _update_capacity_limits_from_actual_data(self):
         """
         Update capacity limits based on actual optimizer output.
@@ -549,7 +633,7 @@ class FixedExecutiveReportGenerator:
 
         This fixes the >100% utilization issue caused by hardcoded underestimates.
         """
-        weekly_df = self.data.get('Weekly_Summary', pd.DataFrame())
+        weekly_df = self._get_sheet('Weekly_Summary')
 
         if weekly_df.empty:
             print("     ⚠ No Weekly_Summary data, using default capacity limits")
@@ -612,6 +696,10 @@ class FixedExecutiveReportGenerator:
                 print(f"  ⚠ Skipped {sheet_name}: {e}")
         
         self._determine_weeks()
+        self._changeover_summary = None
+
+        # Store repeated part codes as categoricals for cheaper filters and groupbys
+        self._categorize_stage_parts()
 
         # Update capacity limits based on actual optimizer output
         self._update_capacity_limits_from_actual_data()
@@ -622,9 +710,18 @@ class FixedExecutiveReportGenerator:
         # Create comprehensive Part Daily Schedule for ALL 8 stages
         self._create_part_daily_schedule()
 
+        # Shrink whole-number columns of the daily sheets before the formatting passes
+        self._downcast_daily_counts()
+        self._categorize_daily_labels()
+
         print(f"✅ Loaded {len(self.data)} sheets")
         print(f"📅 Planning horizon: Weeks {min(self.weeks) if self.weeks else 1} to {max(self.weeks) if self.weeks else 1} ({self.num_weeks} weeks)\n")
     
+    def _get_sheet(self, sheet_name):
+        """Return a loaded sheet, building an empty DataFrame only when the sheet is missing"""
+        df = self.data.get(sheet_name)
+        return df if df is not None else pd.DataFrame()
+
     def _determine_weeks(self):
         """Dynamically determine the planning weeks from available data."""
         weeks_set = set()
@@ -648,25 +745,74 @@ class FixedExecutiveReportGenerator:
             self.weeks = sorted([int(w) for w in weeks_set if pd.notna(w)])
             # FIX: Use MAX week number, not COUNT of weeks
             self.num_weeks = max(self.weeks) if self.weeks else 0
+            self._weeks_set = frozenset(self.weeks)
         else:
             print("  ⚠ Warning: Could not determine weeks from data, defaulting to 1-30")
             self.weeks = list(range(1, 31))
+            self._weeks_set = frozenset(self.weeks)
             self.num_weeks = 30
     
+    def _categorize_stage_parts(self):
+        """Convert the 'Part' column of per-stage schedule sheets to category dtype"""
+        stage_sheets = ['Casting', 'Grinding', 'Machining_Stage1', 'Machining_Stage2', 'Machining_Stage3',
+                        'Painting_Stage1', 'Painting_Stage2', 'Painting_Stage3', 'Delivery']
+
+        for sheet_name in stage_sheets:
+            df = self.data.get(sheet_name)
+            if df is not None and 'Part' in df.columns:
+                df['Part'] = df['Part'].astype('category')
+
+    def _downcast_daily_counts(self):
+        """Store int64 columns of the daily schedule sheets as int32"""
+        # int32 rather than the smallest fit keeps headroom for unit sums; fractional quantities
+        # (tons, evenly split units, hours, utilization) stay float64 so report rounding is unchanged
+        for sheet_name in ['Daily_Schedule', 'Part_Daily_Schedule']:
+            df = self.data.get(sheet_name)
+            if df is None or df.empty:
+                continue
+            int_cols = df.select_dtypes(include='int64').columns
+            if len(int_cols) > 0:
+                df[int_cols] = df[int_cols].astype('int32')
+
+    def _categorize_daily_labels(self):
+        """Convert repeated label columns of the daily schedule sheets to category dtype"""
+        label_columns = {
+            'Daily_Schedule': ['Day', 'Is_Holiday'],
+            'Part_Daily_Schedule': ['Operation', 'Day', 'Machine_Resource', 'Customer', 'Part', 'Sales_Order']
+        }
+
+        for sheet_name, columns in label_columns.items():
+            df = self.data.get(sheet_name)
+            if df is None or df.empty:
+                continue
+            for col in columns:
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
+
+    def _changeover_stats(self):
+        """Summarize Pattern_Changeovers once (total, per-line counts, busy weeks) for reuse across sheets"""
+        if self._changeover_summary is None:
+            changeovers = self._get_sheet('Pattern_Changeovers')
+            if changeovers.empty:
+                weekly_counts = pd.Series(dtype=int)
+            else:
+                weekly_counts = changeovers.groupby('Week').size()
+            line_counts = changeovers['Line'].value_counts() if 'Line' in changeovers.columns else pd.Series(dtype=int)
+
+            self._changeover_summary = {
+                'total': len(changeovers),
+                'line_counts': line_counts,
+                'high_changeover_weeks': weekly_counts[weekly_counts > 5]
+            }
+        return self._changeover_summary
+
     def _create_machine_utilization_fixed(self):
         """
         FIXED: Create machine utilization for ALL 8 STAGES using Weekly_Summary data
         """
         print("  📊 Creating machine utilization for ALL 8 stages...")
         
-        weekly = self.data.get('Weekly_Summary', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
+        weekly = self._get_sheet('Weekly_Summary')
         
         if weekly.empty:
             print("    ⚠ No Weekly_Summary data available")
@@ -674,11 +820,15 @@ class FixedExecutiveReportGenerator:
             return
         
         util_data = []
+
+        # Keep only planning-horizon weeks with one vectorized filter instead of a per-row membership check
+        if 'Week' in weekly.columns:
+            weekly = weekly[weekly['Week'].isin(self._weeks_set)]
+        else:
+            weekly = weekly.iloc[0:0]
         
         for _, row in weekly.iterrows():
-            week = row.get('Week', None)
-            if week is None or week not in self.weeks:
-                continue
+            week = row['Week']
             
             # Calculate utilization for each stage as: (actual / capacity) * 100
             util_row = {'Week': week}
@@ -744,7 +894,17 @@ class FixedExecutiveReportGenerator:
             
             util_data.append(util_row)
         
-        self.data['Machine_Utilization'] = pd.DataFrame(util_data)
+        util_df = pd.DataFrame(util_data)
+
+        # Load/capacity columns are carried along but never formatted, so store them compactly.
+        # Utilization % columns stay float64: float32 shifts values such as 63.75 across the
+        # one-decimal rounding boundary used in the report sheets.
+        for col in util_df.columns:
+            if ('_Load_' in col or '_Cap_' in col) and pd.api.types.is_numeric_dtype(util_df[col]):
+                downcast = 'integer' if pd.api.types.is_integer_dtype(util_df[col]) else 'float'
+                util_df[col] = pd.to_numeric(util_df[col], downcast=downcast)
+
+        self.data['Machine_Utilization'] = util_df
         print(f"    ✓ Created utilization for ALL 8 stages across {len(util_data)} weeks")
 
     def _distribute_units_intelligently(self, total_units, working_days, batch_size=1, max_daily_units=50):
@@ -849,7 +1009,7 @@ class FixedExecutiveReportGenerator:
         print("  📋 Creating Order-Specific Daily Schedule with whole number units...")
 
         # Load Shipment_Allocation (one row per sales order + part combination)
-        shipment_alloc = self.data.get('Shipment_Allocation', pd.DataFrame())
+        shipment_alloc = self._get_sheet('Shipment_Allocation')
 
         if shipment_alloc.empty:
             print("    ⚠ No Shipment_Allocation data available")
@@ -857,7 +1017,7 @@ class FixedExecutiveReportGenerator:
 
             # Fallback: Try to read Part_Daily_Schedule from comprehensive input
             try:
-                part_daily = self.data.get('Part_Daily_Schedule', pd.DataFrame())
+                part_daily = self._get_sheet('Part_Daily_Schedule')
                 if not part_daily.empty:
                     self.data['Part_Daily_Schedule'] = part_daily
                     print(f"    ✓ Successfully loaded {len(part_daily):,} part-daily entries from comprehensive output")
@@ -1153,13 +1313,13 @@ class FixedExecutiveReportGenerator:
         """
         print("📊 Creating Executive Dashboard (FIXED - ALL 8 STAGES)...")
         
-        weekly = self.data.get('Weekly_Summary', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        delivery = self.data.get('Delivery', pd.DataFrame())
-        unmet = self.data.get('Unmet_Demand', pd.DataFrame())
-        fulfillment = self.data.get('Fulfillment_Summary', pd.DataFrame())
-        changeovers = self.data.get('Pattern_Changeovers', pd.DataFrame())
-        vacuum = self.data.get('Vacuum_Utilization', pd.DataFrame())
+        weekly = self._get_sheet('Weekly_Summary')
+        machines = self._get_sheet('Machine_Utilization')
+        delivery = self._get_sheet('Delivery')
+        unmet = self._get_sheet('Unmet_Demand')
+        fulfillment = self._get_sheet('Fulfillment_Summary')
+        changeovers = self._get_sheet('Pattern_Changeovers')
+        vacuum = self._get_sheet('Vacuum_Utilization')
         
         sections = []
         
@@ -1332,7 +1492,7 @@ class FixedExecutiveReportGenerator:
         """SHEET 2: MASTER SCHEDULE"""
         print("📅 Creating Master Schedule...")
         
-        shipment_schedule = self.data.get('Shipment_Schedule', pd.DataFrame())
+        shipment_schedule = self._get_sheet('Shipment_Schedule')
         
         if shipment_schedule.empty or 'Material_Code' not in shipment_schedule.columns:
             return self._create_simple_schedule()
@@ -1417,8 +1577,8 @@ class FixedExecutiveReportGenerator:
 
     def _create_simple_schedule(self):
         """Fallback schedule"""
-        casting = self.data.get('Casting', pd.DataFrame())
-        delivery = self.data.get('Delivery', pd.DataFrame())
+        casting = self._get_sheet('Casting')
+        delivery = self._get_sheet('Delivery')
         
         schedule_rows = []
         schedule_rows.append(['MASTER PRODUCTION SCHEDULE', '', '', '', '', ''])
@@ -1469,7 +1629,7 @@ class FixedExecutiveReportGenerator:
             return "IMPOSSIBLE_TIMELINE"
 
         # Check if there's capacity constraint
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
+        machines = self._get_sheet('Machine_Utilization')
         if not machines.empty:
             # Check weeks around committed delivery
             weeks_to_check = range(max(1, committed_week - 3), committed_week + 1)
@@ -1482,7 +1642,7 @@ class FixedExecutiveReportGenerator:
                             return "CAPACITY_BOTTLENECK"
 
         # Check if WIP exists but insufficient
-        wip = self.data.get('WIP_Initial', pd.DataFrame())
+        wip = self._get_sheet('WIP_Initial')
         if not wip.empty and 'Part' in wip.columns:
             part_wip = wip[wip['Part'] == material]
             if not part_wip.empty:
@@ -1519,7 +1679,7 @@ class FixedExecutiveReportGenerator:
             })
 
             # Check if partial delivery from WIP possible
-            wip = self.data.get('WIP_Initial', pd.DataFrame())
+            wip = self._get_sheet('WIP_Initial')
             if not wip.empty and 'Part' in wip.columns:
                 part_wip = wip[wip['Part'] == material]
                 if not part_wip.empty:
@@ -1538,7 +1698,7 @@ class FixedExecutiveReportGenerator:
 
         elif root_cause == "CAPACITY_BOTTLENECK":
             # Find the bottleneck stage
-            machines = self.data.get('Machine_Utilization', pd.DataFrame())
+            machines = self._get_sheet('Machine_Utilization')
             bottleneck_stage = "production"
             bottleneck_util = 0
             bottleneck_week = committed_week
@@ -1580,13 +1740,12 @@ class FixedExecutiveReportGenerator:
 
             # Check for weeks with available capacity
             if not machines.empty:
-                low_util_weeks = []
-                for week in range(1, self.num_weeks + 1):
-                    week_data = machines[machines['Week'] == week]
-                    if not week_data.empty:
-                        max_util = max([week_data[col].values[0] for col in week_data.columns if 'Util_%' in col])
-                        if max_util < 75:
-                            low_util_weeks.append(week)
+                # Peak stage utilization per week in one row-wise reduction
+                util_cols = [col for col in machines.columns if 'Util_%' in col]
+                week_rows = machines.drop_duplicates('Week')
+                week_max_util = week_rows[util_cols].to_numpy(dtype=float).max(axis=1)
+                low_util_weeks = [int(week) for week, max_util in zip(week_rows['Week'], week_max_util)
+                                  if 1 <= week <= self.num_weeks and max_util < 75]
 
                 if low_util_weeks:
                     alt_week = min([w for w in low_util_weeks if w > committed_week], default=None)
@@ -1602,7 +1761,7 @@ class FixedExecutiveReportGenerator:
                         })
 
         elif root_cause == "WIP_INSUFFICIENT":
-            wip = self.data.get('WIP_Initial', pd.DataFrame())
+            wip = self._get_sheet('WIP_Initial')
             if not wip.empty and 'Part' in wip.columns:
                 part_wip = wip[wip['Part'] == material]
                 if not part_wip.empty:
@@ -1647,11 +1806,11 @@ class FixedExecutiveReportGenerator:
         """SHEET 3: DELIVERY TRACKER WITH WIP BREAKDOWN"""
         print("🚚 Creating Delivery Tracker with WIP breakdown...")
 
-        shipments = self.data.get('Shipment_Schedule', pd.DataFrame())
-        orders = self.data.get('Order_Fulfillment', pd.DataFrame())
-        wip_initial = self.data.get('WIP_Initial', pd.DataFrame())
-        casting = self.data.get('Casting', pd.DataFrame())
-        delivery = self.data.get('Delivery', pd.DataFrame())
+        shipments = self._get_sheet('Shipment_Schedule')
+        orders = self._get_sheet('Order_Fulfillment')
+        wip_initial = self._get_sheet('WIP_Initial')
+        casting = self._get_sheet('Casting')
+        delivery = self._get_sheet('Delivery')
 
         # Calculate WIP breakdown by part
         wip_by_part = {}
@@ -1672,13 +1831,13 @@ class FixedExecutiveReportGenerator:
         # Calculate new production (casting) by part
         cast_by_part = {}
         if not casting.empty and 'Part' in casting.columns:
-            cast_grouped = casting.groupby('Part')['Units'].sum()
+            cast_grouped = casting.groupby('Part', observed=True)['Units'].sum()
             cast_by_part = cast_grouped.to_dict()
 
         # Calculate total delivered by part
         delivered_by_part = {}
         if not delivery.empty and 'Part' in delivery.columns:
-            del_grouped = delivery.groupby('Part')['Units'].sum()
+            del_grouped = delivery.groupby('Part', observed=True)['Units'].sum()
             delivered_by_part = del_grouped.to_dict()
 
         tracker_rows = []
@@ -1709,20 +1868,16 @@ class FixedExecutiveReportGenerator:
 
         # ADD WEEKLY DELIVERY SUMMARY TABLE
         if not shipments.empty:
-            # Calculate delivery count per week
-            weekly_summary = {}
-            for week_num in range(1, self.num_weeks + 1):
-                week_deliveries = shipments[shipments['Week'] == week_num]
-                weekly_summary[week_num] = len(week_deliveries)
+            # Calculate delivery count per week in a single pass
+            weekly_counts = shipments.groupby('Week', sort=True).size().reindex(
+                range(1, self.num_weeks + 1), fill_value=0)
             
             tracker_rows.append(['WEEKLY DELIVERY SUMMARY', '', '', '', '', '', '', '', '', '', '', ''])
             tracker_rows.append(['Overview of deliveries scheduled per week | Some weeks may show zero deliveries due to early fulfillment from WIP', '', '', '', '', '', '', '', '', '', '', ''])
             tracker_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
             tracker_rows.append(['Week', 'Deliveries', 'Status', '', '', '', '', '', '', '', '', ''])
             
-            for week_num in range(1, self.num_weeks + 1):
-                delivery_count = weekly_summary.get(week_num, 0)
-                
+            for week_num, delivery_count in weekly_counts.items():
                 if delivery_count == 0:
                     status = '- No shipments'
                 elif delivery_count == 1:
@@ -1895,7 +2050,7 @@ class FixedExecutiveReportGenerator:
             tracker_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
             tracker_rows.append(['Part', 'Initial WIP', 'New Production', 'Total Delivered', 'WIP Used %', '', '', '', '', '', '', ''])
 
-            all_parts = set(list(wip_by_part.keys()) + list(cast_by_part.keys()) + list(delivered_by_part.keys()))
+            all_parts = wip_by_part.keys() | cast_by_part.keys() | delivered_by_part.keys()
             for part in sorted(all_parts)[:50]:  # Limit to top 50 parts
                 wip = wip_by_part.get(part, {}).get('total_wip', 0)
                 new_prod = cast_by_part.get(part, 0)
@@ -1985,8 +2140,8 @@ class FixedExecutiveReportGenerator:
         """SHEET: WIP_DRAWDOWN_TIMELINE - Track WIP consumption and depletion over planning horizon"""
         print("📊 Creating WIP Drawdown Timeline...")
 
-        wip_consumption = self.data.get('WIP_Consumption', pd.DataFrame())
-        wip_initial = self.data.get('WIP_Initial', pd.DataFrame())
+        wip_consumption = self._get_sheet('WIP_Consumption')
+        wip_initial = self._get_sheet('WIP_Initial')
 
         timeline_rows = []
         timeline_rows.append(['WIP INVENTORY DRAWDOWN TIMELINE', '', '', '', '', '', '', ''])
@@ -2126,11 +2281,11 @@ class FixedExecutiveReportGenerator:
         """SHEET 4: BOTTLENECK ALERTS - FIXED to check ALL 8 stages"""
         print("⚠️ Creating Bottleneck Alerts (FIXED - ALL 8 STAGES)...")
         
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        weekly = self.data.get('Weekly_Summary', pd.DataFrame())
-        unmet = self.data.get('Unmet_Demand', pd.DataFrame())
-        vacuum = self.data.get('Vacuum_Utilization', pd.DataFrame())
-        changeovers = self.data.get('Pattern_Changeovers', pd.DataFrame())
+        machines = self._get_sheet('Machine_Utilization')
+        weekly = self._get_sheet('Weekly_Summary')
+        unmet = self._get_sheet('Unmet_Demand')
+        vacuum = self._get_sheet('Vacuum_Utilization')
+        changeovers = self._get_sheet('Pattern_Changeovers')
         
         alert_rows = []
         alert_rows.append(['BOTTLENECK ALERTS & ACTION ITEMS - ALL 8 STAGES', '', '', '', ''])
@@ -2138,24 +2293,30 @@ class FixedExecutiveReportGenerator:
         alert_rows.append(['', '', '', '', ''])
         alert_rows.append(['Priority', 'Resource/Issue', 'Impact', 'Action Required', 'Timeline'])
         
+        # Alerts are (rank, insertion order, priority, resource, impact, action, timeline) tuples
+        # so a plain sort orders them by priority while keeping insertion order within a rank
+        priority_order = {'CRITICAL': 0, 'WARNING': 1, 'HEALTHY': 2}
         alerts = []
+
+        def add_alert(priority, resource, impact, action, timeline):
+            alerts.append((priority_order[priority], len(alerts), priority, resource, impact, action, timeline))
         
         # Check unmet demand
         if not unmet.empty and len(unmet) > 0:
             total_unmet = unmet['Unmet'].sum() if 'Unmet' in unmet.columns else len(unmet)
             if total_unmet > 0:
-                alerts.append(('CRITICAL', 'Unmet Customer Demand', 
-                             f'{total_unmet:,.0f} units cannot be fulfilled', 
-                             'Increase capacity or reschedule', 'Immediate'))
+                add_alert('CRITICAL', 'Unmet Customer Demand', 
+                          f'{total_unmet:,.0f} units cannot be fulfilled', 
+                          'Increase capacity or reschedule', 'Immediate')
         
         # Check vacuum lines
         if not vacuum.empty:
             big_overload = vacuum[vacuum['Big_Line_Util_%'] >= 100]
             if not big_overload.empty:
                 weeks = ', '.join([f"W{int(w)}" for w in big_overload['Week'].head(3).values])
-                alerts.append(('CRITICAL', 'Big Vacuum Line Overload',
-                             f'{len(big_overload)} weeks exceed capacity ({weeks}...)',
-                             'Reduce parts or add line capacity', 'This Week'))
+                add_alert('CRITICAL', 'Big Vacuum Line Overload',
+                          f'{len(big_overload)} weeks exceed capacity ({weeks}...)',
+                          'Reduce parts or add line capacity', 'This Week')
         
         # FIXED: Check ALL 8 stages for bottlenecks
         if not machines.empty:
@@ -2174,45 +2335,39 @@ class FixedExecutiveReportGenerator:
             
             for stage_name, util_col in stage_checks:
                 if util_col in machines.columns:
-                    critical = machines[machines[util_col] >= 95]
-                    warning = machines[(machines[util_col] >= 85) & (machines[util_col] < 95)]
+                    util = machines[util_col].to_numpy()
+                    critical_count = int((util >= 95).sum())
+                    warning_count = int(((util >= 85) & (util < 95)).sum())
                     
-                    if not critical.empty:
-                        max_util = critical[util_col].max()
-                        alerts.append(('CRITICAL', f'{stage_name} Capacity',
-                                     f'{len(critical)} weeks at {max_util:.0f}% utilization',
-                                     'Add shifts or reduce weekly load', 'This Week'))
-                    elif not warning.empty:
-                        alerts.append(('WARNING', f'{stage_name} Approaching Limit',
-                                     f'{len(warning)} weeks at 85-95% utilization',
-                                     'Monitor and plan capacity increase', 'Next 2 Weeks'))
+                    if critical_count:
+                        max_util = util[util >= 95].max()
+                        add_alert('CRITICAL', f'{stage_name} Capacity',
+                                  f'{critical_count} weeks at {max_util:.0f}% utilization',
+                                  'Add shifts or reduce weekly load', 'This Week')
+                    elif warning_count:
+                        add_alert('WARNING', f'{stage_name} Approaching Limit',
+                                  f'{warning_count} weeks at 85-95% utilization',
+                                  'Monitor and plan capacity increase', 'Next 2 Weeks')
         
         # Check changeovers
         if not changeovers.empty:
-            high_changeover_weeks = changeovers.groupby('Week').size()
-            high_changeover_weeks = high_changeover_weeks[high_changeover_weeks > 5]
+            changeover_stats = self._changeover_stats()
+            high_changeover_weeks = changeover_stats['high_changeover_weeks']
             if not high_changeover_weeks.empty:
-                total_setup_hours = (len(changeovers) * 18) / 60
-                alerts.append(('WARNING', 'Excessive Pattern Changeovers',
-                             f'{len(high_changeover_weeks)} weeks with >5 changeovers ({total_setup_hours:.1f} hours lost)',
-                             'Consolidate parts or extend batches', 'Ongoing'))
+                total_setup_hours = (changeover_stats['total'] * 18) / 60
+                add_alert('WARNING', 'Excessive Pattern Changeovers',
+                          f'{len(high_changeover_weeks)} weeks with >5 changeovers ({total_setup_hours:.1f} hours lost)',
+                          'Consolidate parts or extend batches', 'Ongoing')
         
         if not alerts:
-            alerts.append(('HEALTHY', 'No Critical Issues',
-                         'All systems operating normally',
-                         'Continue monitoring', 'N/A'))
+            add_alert('HEALTHY', 'No Critical Issues',
+                      'All systems operating normally',
+                      'Continue monitoring', 'N/A')
         
-        priority_order = {'CRITICAL': 0, 'WARNING': 1, 'HEALTHY': 2}
-        alerts.sort(key=lambda x: priority_order.get(x[0], 3))
+        alerts.sort()
         
-        for priority, resource, impact, action, timeline in alerts:
-            if priority == 'CRITICAL':
-                icon = '🔴'
-            elif priority == 'WARNING':
-                icon = '🟡'
-            else:
-                icon = '🟢'
-            
+        for _, _, priority, resource, impact, action, timeline in alerts:
+            icon = STATUS_ICONS.get(priority, STATUS_ICONS['HEALTHY'])
             alert_rows.append([f'{icon} {priority}', resource, impact, action, timeline])
         
         return pd.DataFrame(alert_rows)
@@ -2221,9 +2376,9 @@ class FixedExecutiveReportGenerator:
         """SHEET 5: CAPACITY OVERVIEW - FIXED to show ALL 8 stages"""
         print("📈 Creating Capacity Overview (FIXED - ALL 8 STAGES)...")
         
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
-        vacuum = self.data.get('Vacuum_Utilization', pd.DataFrame())
-        changeovers = self.data.get('Pattern_Changeovers', pd.DataFrame())
+        machines = self._get_sheet('Machine_Utilization')
+        vacuum = self._get_sheet('Vacuum_Utilization')
+        changeovers = self._get_sheet('Pattern_Changeovers')
         
         overview_rows = []
         overview_rows.append(['CAPACITY UTILIZATION OVERVIEW - ALL 8 STAGES', '', '', '', '', ''])
@@ -2249,14 +2404,21 @@ class FixedExecutiveReportGenerator:
                 ('Small Line Moulding', 'Small_Line_Util_%')
             ]
             
+            # Aggregate all stage columns at once instead of re-scanning per stage
+            stage_cols = [col for _, col in operations if col in machines.columns]
+            stage_stats = machines[stage_cols].agg(['mean', 'max'])
+
+            # Drop idle stages (no load in any week) before counting or formatting them
+            stage_cols = [col for col in stage_cols
+                          if not (stage_stats.at['mean', col] == 0 and stage_stats.at['max', col] == 0)]
+            stage_stats = stage_stats[stage_cols].to_dict()
+            critical_counts = (machines[stage_cols] >= 95).sum().to_dict()
+
             for op_name, col_name in operations:
-                if col_name in machines.columns:
-                    avg_util = machines[col_name].mean()
-                    max_util = machines[col_name].max()
-                    critical_weeks = len(machines[machines[col_name] >= 95])
-                    
-                    if avg_util == 0 and max_util == 0:
-                        continue
+                if col_name in stage_stats:
+                    avg_util = stage_stats[col_name]['mean']
+                    max_util = stage_stats[col_name]['max']
+                    critical_weeks = int(critical_counts[col_name])
                     
                     if max_util >= 95:
                         status = '🔴 Critical'
@@ -2313,7 +2475,8 @@ class FixedExecutiveReportGenerator:
             overview_rows.append(['', '', '', '', '', ''])
             overview_rows.append(['Metric', 'Value', 'Weekly Average', 'Impact', '', ''])
             
-            total_changes = len(changeovers)
+            changeover_stats = self._changeover_stats()
+            total_changes = changeover_stats['total']
             total_hours = (total_changes * 18) / 60
             avg_per_week = total_changes / self.num_weeks
             
@@ -2321,8 +2484,8 @@ class FixedExecutiveReportGenerator:
                                  f'{total_hours:.1f} hours lost', '', ''])
             
             if 'Line' in changeovers.columns:
-                big_changes = len(changeovers[changeovers['Line'] == 'Big'])
-                small_changes = len(changeovers[changeovers['Line'] == 'Small'])
+                big_changes = int(changeover_stats['line_counts'].get('Big', 0))
+                small_changes = int(changeover_stats['line_counts'].get('Small', 0))
                 overview_rows.append(['Big Line Changes', f'{big_changes}', f'{big_changes/self.num_weeks:.1f}/week',
                                      f'{big_changes*18/60:.1f} hours', '', ''])
                 overview_rows.append(['Small Line Changes', f'{small_changes}', f'{small_changes/self.num_weeks:.1f}/week',
@@ -2336,46 +2499,25 @@ class FixedExecutiveReportGenerator:
         overview_rows.append(['Week', 'Cast%', 'Grind%', 'MC1%', 'MC2%', 'MC3%', 'SP1%', 'SP2%', 'SP3%', 'Big Line%', 'Small Line%', 'Status'])
         
         if not machines.empty:
-            for _, row in machines.iterrows():
-                week = row.get('Week', None)
-                if week is None or week not in self.weeks:
-                    continue
-                
-                cast_util = row.get('Casting_Util_%', 0)
-                grind_util = row.get('Grinding_Util_%', 0)
-                mc1_util = row.get('MC1_Util_%', 0)
-                mc2_util = row.get('MC2_Util_%', 0)
-                mc3_util = row.get('MC3_Util_%', 0)
-                sp1_util = row.get('SP1_Util_%', 0)
-                sp2_util = row.get('SP2_Util_%', 0)
-                sp3_util = row.get('SP3_Util_%', 0)
-                
-                big_line_util = row.get('Big_Line_Util_%', 0)
-                small_line_util = row.get('Small_Line_Util_%', 0)
-                max_util = max(cast_util, grind_util, mc1_util, mc2_util, mc3_util, sp1_util, sp2_util, sp3_util,
-                               big_line_util, small_line_util)
-                
-                if max_util >= 95:
-                    status = '🔴 Critical'
-                elif max_util >= 85:
-                    status = '🟡 Warning'
-                else:
-                    status = '🟢 Healthy'
-                
-                overview_rows.append([
-                    f'W{int(week)}',
-                    f'{cast_util:.1f}%',
-                    f'{grind_util:.1f}%',
-                    f'{mc1_util:.1f}%',
-                    f'{mc2_util:.1f}%',
-                    f'{mc3_util:.1f}%',
-                    f'{sp1_util:.1f}%',
-                    f'{sp2_util:.1f}%',
-                    f'{sp3_util:.1f}%',
-                    f'{big_line_util:.1f}%',
-                    f'{small_line_util:.1f}%',
-                    status
-                ])
+            weekly_util_cols = ['Casting_Util_%', 'Grinding_Util_%', 'MC1_Util_%', 'MC2_Util_%', 'MC3_Util_%',
+                                'SP1_Util_%', 'SP2_Util_%', 'SP3_Util_%', 'Big_Line_Util_%', 'Small_Line_Util_%']
+
+            # Format and classify all weeks at once instead of per-row Python max()/f-strings
+            weekly_util = machines[machines['Week'].isin(self._weeks_set)]
+            util_arr = weekly_util.reindex(columns=weekly_util_cols, fill_value=0).to_numpy(dtype=float)
+            max_util_arr = util_arr.max(axis=1)
+            status_arr = pd.cut(max_util_arr, bins=[-np.inf, 85, 95, np.inf], right=False,
+                                labels=[f"{STATUS_ICONS['HEALTHY']} Healthy",
+                                        f"{STATUS_ICONS['WARNING']} Warning",
+                                        f"{STATUS_ICONS['CRITICAL']} Critical"]).astype(str)
+            util_strs = np.char.add(np.char.mod('%.1f', util_arr), '%')
+            week_strs = [f'W{int(w)}' for w in weekly_util['Week']]
+
+            # Build the weekly block column-wise and append it to the ragged header/summary rows
+            weekly_df = pd.DataFrame(util_strs, columns=range(1, len(weekly_util_cols) + 1))
+            weekly_df.insert(0, 0, week_strs)
+            weekly_df[len(weekly_util_cols) + 1] = status_arr
+            return pd.concat([pd.DataFrame(overview_rows), weekly_df], ignore_index=True)
         
         return pd.DataFrame(overview_rows)
 
@@ -2383,8 +2525,8 @@ class FixedExecutiveReportGenerator:
         """SHEET 6: MATERIAL FLOW - Already has all 8 stages"""
         print("🔄 Creating Material Flow (ALL 8 STAGES)...")
 
-        weekly = self.data.get('Weekly_Summary', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
+        weekly = self._get_sheet('Weekly_Summary')
+        machines = self._get_sheet('Machine_Utilization')
         if weekly.empty:
             return pd.DataFrame([['No tonnage data available']])
         
@@ -2398,69 +2540,48 @@ class FixedExecutiveReportGenerator:
             'Delivery', 'Big Line Util %', 'Small Line Util %', 'Notes'
         ])
         
-        for _, row in weekly.iterrows():
-            week = row.get('Week', None)
-            if week is None or week not in self.weeks:
-                continue
-            
-            mc2_units = row.get('MC2_Units', 0)
-            sp2_units = row.get('SP2_Units', 0)
-            notes = []
-            if mc2_units > 0 and row.get('MC3_Units', 0) < mc2_units * 0.5:
-                notes.append('MC3 bottleneck')
-            if sp2_units > 0 and row.get('SP3_Units', 0) < sp2_units * 0.5:
-                notes.append('SP3 bottleneck')
-            
-            flow_rows.append([
-                f'W{int(week)}',
-                f'{row.get("Casting_Tons", 0):.0f}',
-                f'{row.get("Grinding_Units", 0):.0f}',
-                f'{row.get("MC1_Units", 0):.0f}',
-                f'{row.get("MC2_Units", 0):.0f}',
-                f'{row.get("MC3_Units", 0):.0f}',
-                f'{row.get("SP1_Units", 0):.0f}',
-                f'{row.get("SP2_Units", 0):.0f}',
-                f'{row.get("SP3_Units", 0):.0f}',
-                f'{row.get("Delivery_Units", 0):.0f}',
-                f'{row.get("Big_Line_Util_%", 0):.1f}%' if 'Big_Line_Util_%' in row.index else '-',
-                f'{row.get("Small_Line_Util_%", 0):.1f}%' if 'Small_Line_Util_%' in row.index else '-',
-                ', '.join(notes) if notes else ''
-            ])
-        
+        flow_cols = ['Casting_Tons', 'Grinding_Units', 'MC1_Units', 'MC2_Units', 'MC3_Units',
+                     'SP1_Units', 'SP2_Units', 'SP3_Units', 'Delivery_Units']
+
+        # Format all weeks in one vectorized pass instead of per-row Series access
+        flow = weekly[weekly['Week'].isin(self._weeks_set)]
+        units = flow.reindex(columns=flow_cols, fill_value=0).to_numpy(dtype=float)
+        unit_strs = np.char.mod('%.0f', units)
+        week_strs = np.array([f'W{int(w)}' for w in flow['Week']], dtype=str)
+
+        util_strs = []
+        for util_col in ['Big_Line_Util_%', 'Small_Line_Util_%']:
+            if util_col in flow.columns:
+                util_strs.append(np.char.add(np.char.mod('%.1f', flow[util_col].to_numpy(dtype=float)), '%'))
+            else:
+                util_strs.append(np.full(len(flow), '-'))
+
+        mc2_units, mc3_units = units[:, 3], units[:, 4]
+        sp2_units, sp3_units = units[:, 6], units[:, 7]
+        mc3_bottleneck = (mc2_units > 0) & (mc3_units < mc2_units * 0.5)
+        sp3_bottleneck = (sp2_units > 0) & (sp3_units < sp2_units * 0.5)
+        notes = np.array([
+            ', '.join(note for note, flag in (('MC3 bottleneck', mc3), ('SP3 bottleneck', sp3)) if flag)
+            for mc3, sp3 in zip(mc3_bottleneck, sp3_bottleneck)
+        ], dtype=str)
+
+        if len(flow) > 0:
+            flow_rows.extend(np.column_stack([week_strs, unit_strs, *util_strs, notes]).tolist())
+
         flow_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
         big_util_avg = weekly['Big_Line_Util_%'].mean() if 'Big_Line_Util_%' in weekly.columns and len(weekly) > 0 else None
         small_util_avg = weekly['Small_Line_Util_%'].mean() if 'Small_Line_Util_%' in weekly.columns and len(weekly) > 0 else None
-        flow_rows.append([
-            'TOTAL',
-            f'{weekly["Casting_Tons"].sum():.0f}',
-            f'{weekly.get("Grinding_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("MC1_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("MC2_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("MC3_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("SP1_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("SP2_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly.get("SP3_Units", pd.Series([0])).sum():.0f}',
-            f'{weekly["Delivery_Units"].sum():.0f}',
-            f'{big_util_avg:.1f}%' if big_util_avg is not None else '-',
-            f'{small_util_avg:.1f}%' if small_util_avg is not None else '-',
-            ''
-        ])
-        
-        flow_rows.append([
-            'AVERAGE',
-            f'{weekly["Casting_Tons"].mean():.0f}',
-            f'{weekly.get("Grinding_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("MC1_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("MC2_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("MC3_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("SP1_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("SP2_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly.get("SP3_Units", pd.Series([0])).mean():.0f}',
-            f'{weekly["Delivery_Units"].mean():.0f}',
-            f'{big_util_avg:.1f}%' if big_util_avg is not None else '-',
-            f'{small_util_avg:.1f}%' if small_util_avg is not None else '-',
-            ''
-        ])
+        big_util_str = f'{big_util_avg:.1f}%' if big_util_avg is not None else '-'
+        small_util_str = f'{small_util_avg:.1f}%' if small_util_avg is not None else '-'
+
+        # Reduce each stage column once and reuse for TOTAL, AVERAGE and the transitions table
+        all_units = weekly.reindex(columns=flow_cols + ['Big_Line_Hours', 'Small_Line_Hours'], fill_value=0)
+        totals = all_units.sum()
+        means = all_units.mean()
+        flow_rows.append(['TOTAL', *np.char.mod('%.0f', totals[flow_cols].to_numpy(dtype=float)).tolist(),
+                          big_util_str, small_util_str, ''])
+        flow_rows.append(['AVERAGE', *np.char.mod('%.0f', means[flow_cols].to_numpy(dtype=float)).tolist(),
+                          big_util_str, small_util_str, ''])
         
         flow_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
         flow_rows.append(['COMPLETE STAGE FLOW ANALYSIS', '', '', '', '', '', '', '', '', '', '', '', ''])
@@ -2468,16 +2589,16 @@ class FixedExecutiveReportGenerator:
         flow_rows.append(['From Stage', 'To Stage', 'Total Flow', 'Avg Weekly', 'Balance Status', 'Avg Util %', 'Peak Util %', '', '', '', '', ''])
         
         transitions = [
-            ('Casting', 'Grinding', weekly.get('Grinding_Units', pd.Series([0])).sum()),
-            ('Grinding', 'MC1', weekly.get('MC1_Units', pd.Series([0])).sum()),
-            ('MC1', 'MC2', weekly.get('MC2_Units', pd.Series([0])).sum()),
-            ('MC2', 'MC3', weekly.get('MC3_Units', pd.Series([0])).sum()),
-            ('MC3', 'SP1', weekly.get('SP1_Units', pd.Series([0])).sum()),
-            ('SP1', 'SP2', weekly.get('SP2_Units', pd.Series([0])).sum()),
-            ('SP2', 'SP3', weekly.get('SP3_Units', pd.Series([0])).sum()),
-            ('SP3', 'Delivery', weekly['Delivery_Units'].sum()),
-            ('Big Line', 'Capacity', weekly.get('Big_Line_Hours', pd.Series([0])).sum()),
-            ('Small Line', 'Capacity', weekly.get('Small_Line_Hours', pd.Series([0])).sum())
+            ('Casting', 'Grinding', totals['Grinding_Units']),
+            ('Grinding', 'MC1', totals['MC1_Units']),
+            ('MC1', 'MC2', totals['MC2_Units']),
+            ('MC2', 'MC3', totals['MC3_Units']),
+            ('MC3', 'SP1', totals['SP1_Units']),
+            ('SP1', 'SP2', totals['SP2_Units']),
+            ('SP2', 'SP3', totals['SP3_Units']),
+            ('SP3', 'Delivery', totals['Delivery_Units']),
+            ('Big Line', 'Capacity', totals['Big_Line_Hours']),
+            ('Small Line', 'Capacity', totals['Small_Line_Hours'])
         ]
 
         util_lookup = {}
@@ -2494,12 +2615,13 @@ class FixedExecutiveReportGenerator:
                 'Big Line': 'Big_Line_Util_%',
                 'Small Line': 'Small_Line_Util_%'
             }
-            for stage_name, col_name in stage_column_map.items():
-                if col_name in machines.columns:
-                    util_lookup[stage_name] = (
-                        machines[col_name].mean(),
-                        machines[col_name].max()
-                    )
+            present_cols = [col for col in stage_column_map.values() if col in machines.columns]
+            util_stats = machines[present_cols].agg(['mean', 'max'])
+            util_lookup = {
+                stage_name: (util_stats.at['mean', col_name], util_stats.at['max', col_name])
+                for stage_name, col_name in stage_column_map.items()
+                if col_name in present_cols
+            }
 
         for from_stage, to_stage, total in transitions:
             avg = total / self.num_weeks if self.num_weeks > 0 else 0
@@ -2524,15 +2646,15 @@ class FixedExecutiveReportGenerator:
         """SHEET 7: GANTT TIMELINE - Already has all 8 stages"""
         print("📋 Creating Gantt Timeline (ALL 8 STAGES)...")
         
-        casting = self.data.get('Casting', pd.DataFrame())
-        grinding = self.data.get('Grinding', pd.DataFrame())
-        delivery = self.data.get('Delivery', pd.DataFrame())
-        mc1 = self.data.get('Machining_Stage1', pd.DataFrame())
-        mc2 = self.data.get('Machining_Stage2', pd.DataFrame())
-        mc3 = self.data.get('Machining_Stage3', pd.DataFrame())
-        sp1 = self.data.get('Painting_Stage1', pd.DataFrame())
-        sp2 = self.data.get('Painting_Stage2', pd.DataFrame())
-        sp3 = self.data.get('Painting_Stage3', pd.DataFrame())
+        casting = self._get_sheet('Casting')
+        grinding = self._get_sheet('Grinding')
+        delivery = self._get_sheet('Delivery')
+        mc1 = self._get_sheet('Machining_Stage1')
+        mc2 = self._get_sheet('Machining_Stage2')
+        mc3 = self._get_sheet('Machining_Stage3')
+        sp1 = self._get_sheet('Painting_Stage1')
+        sp2 = self._get_sheet('Painting_Stage2')
+        sp3 = self._get_sheet('Painting_Stage3')
         
         if casting.empty:
             return pd.DataFrame([['No schedule data available for Gantt']])
@@ -2546,43 +2668,23 @@ class FixedExecutiveReportGenerator:
         
         if 'Part' in casting.columns:
             parts = sorted(casting['Part'].unique()[:30])
-            
+
+            # Precompute week ranges per part for every stage with one groupby each
+            stage_frames = [casting, grinding, mc1, mc2, mc3, sp1, sp2, sp3, delivery]
+            stage_ranges = []
+            for df in stage_frames:
+                if df.empty or 'Part' not in df.columns or 'Week' not in df.columns:
+                    stage_ranges.append({})
+                else:
+                    week_ranges = df.groupby('Part', observed=True)['Week'].agg(['min', 'max'])
+                    stage_ranges.append(dict(zip(week_ranges.index, zip(week_ranges['min'], week_ranges['max']))))
+
+            qty_map = casting.groupby('Part', observed=True)['Units'].sum().to_dict() if 'Units' in casting.columns else {}
+
             for part in parts:
-                part_cast = casting[casting['Part'] == part] if not casting.empty else pd.DataFrame()
-                part_grind = grinding[grinding['Part'] == part] if not grinding.empty and 'Part' in grinding.columns else pd.DataFrame()
-                part_mc1 = mc1[mc1['Part'] == part] if not mc1.empty and 'Part' in mc1.columns else pd.DataFrame()
-                part_mc2 = mc2[mc2['Part'] == part] if not mc2.empty and 'Part' in mc2.columns else pd.DataFrame()
-                part_mc3 = mc3[mc3['Part'] == part] if not mc3.empty and 'Part' in mc3.columns else pd.DataFrame()
-                part_sp1 = sp1[sp1['Part'] == part] if not sp1.empty and 'Part' in sp1.columns else pd.DataFrame()
-                part_sp2 = sp2[sp2['Part'] == part] if not sp2.empty and 'Part' in sp2.columns else pd.DataFrame()
-                part_sp3 = sp3[sp3['Part'] == part] if not sp3.empty and 'Part' in sp3.columns else pd.DataFrame()
-                part_del = delivery[delivery['Part'] == part] if not delivery.empty and 'Part' in delivery.columns else pd.DataFrame()
-                
-                def get_week_range(df):
-                    if df.empty or 'Week' not in df.columns:
-                        return '-'
-                    min_w = int(df['Week'].min())
-                    max_w = int(df['Week'].max())
-                    if min_w == max_w:
-                        return f"W{min_w}"
-                    else:
-                        return f"W{min_w}-{max_w}"
-                
-                cast_weeks = get_week_range(part_cast)
-                grind_weeks = get_week_range(part_grind)
-                mc1_weeks = get_week_range(part_mc1)
-                mc2_weeks = get_week_range(part_mc2)
-                mc3_weeks = get_week_range(part_mc3)
-                sp1_weeks = get_week_range(part_sp1)
-                sp2_weeks = get_week_range(part_sp2)
-                sp3_weeks = get_week_range(part_sp3)
-                del_weeks = get_week_range(part_del)
-                
-                qty = int(part_cast['Units'].sum()) if not part_cast.empty and 'Units' in part_cast.columns else 0
-                
                 gantt_rows.append([
-                    part, qty, cast_weeks, grind_weeks, mc1_weeks, mc2_weeks, mc3_weeks, 
-                    sp1_weeks, sp2_weeks, sp3_weeks, del_weeks
+                    part, int(qty_map.get(part, 0)),
+                    *[self._format_week_range(ranges.get(part)) for ranges in stage_ranges]
                 ])
         
         gantt_rows.append(['', '', '', '', '', '', '', '', '', '', ''])
@@ -2601,12 +2703,33 @@ class FixedExecutiveReportGenerator:
         
         return pd.DataFrame(gantt_rows)
 
+    @staticmethod
+    def _format_week_range(week_range):
+        """Format a (min_week, max_week) tuple as 'W5' or 'W5-7'; '-' when the stage has no rows"""
+        if week_range is None:
+            return '-'
+        min_w, max_w = int(week_range[0]), int(week_range[1])
+        if min_w == max_w:
+            return f"W{min_w}"
+        return f"W{min_w}-{max_w}"
+
+    @staticmethod
+    def _rows_to_frame(rows):
+        """Build a sheet DataFrame from ragged rows via a padded object array (short rows padded with None)"""
+        if not rows:
+            return pd.DataFrame()
+        width = max(len(row) for row in rows)
+        grid = np.empty((len(rows), width), dtype=object)
+        for row_idx, row in enumerate(rows):
+            grid[row_idx, :len(row)] = row
+        return pd.DataFrame(grid)
+
     def create_daily_schedule(self):
         """SHEET 8: DAILY SCHEDULE WITH HOLIDAYS"""
         print("📅 Creating Daily Schedule with calendar dates and holidays...")
 
-        daily = self.data.get('Daily_Schedule', pd.DataFrame())
-        weekly_summary = self.data.get('Weekly_Summary', pd.DataFrame())
+        daily = self._get_sheet('Daily_Schedule')
+        weekly_summary = self._get_sheet('Weekly_Summary')
 
         if daily.empty:
             return pd.DataFrame([['No daily schedule data available']])
@@ -2614,18 +2737,27 @@ class FixedExecutiveReportGenerator:
         schedule_rows = []
         schedule_rows.append(['DAILY PRODUCTION SCHEDULE WITH CALENDAR DATES', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append([f'Day-by-day production plan | Excludes Sundays & India National Holidays | Planning Period: {self.num_weeks} weeks', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_12)
 
         # Calendar summary
         if not daily.empty:
             total_days = len(daily)
-            working_days = len(daily[daily['Is_Holiday'] == 'No']) if 'Is_Holiday' in daily.columns else total_days
+
+            # Classify each day once (Work / Sunday / National) and count in a single pass
+            is_working = daily['Is_Holiday'].eq('No') if 'Is_Holiday' in daily.columns else pd.Series(True, index=daily.index)
+            holiday_names = daily['Holiday_Name'].fillna('').astype(str) if 'Holiday_Name' in daily.columns else pd.Series('', index=daily.index)
+            day_type = pd.Series(np.select([is_working, holiday_names.str.startswith('Sunday')],
+                                           ['Work', 'Sunday'], default='National'),
+                                 index=daily.index).astype('category')
+            day_counts = day_type.value_counts()
+
+            working_days = int(day_counts.get('Work', 0))
             holidays = total_days - working_days
-            sundays = len(daily[daily.get('Holiday_Name', '').str.contains('Sunday', na=False)]) if 'Holiday_Name' in daily.columns else 0
+            sundays = int(day_counts.get('Sunday', 0))
             national_holidays = holidays - sundays
 
             schedule_rows.append(['CALENDAR SUMMARY', '', '', '', '', '', '', '', '', '', '', ''])
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_12)
 
             summary_data = [
                 ['Metric', 'Count', 'Percentage', '', '', '', '', '', '', '', '', ''],
@@ -2637,71 +2769,56 @@ class FixedExecutiveReportGenerator:
             ]
 
             schedule_rows.extend(summary_data)
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_12)
 
         schedule_rows.append(['DAILY PRODUCTION SCHEDULE', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_12)
         schedule_rows.append([
             'Week', 'Date', 'Day', 'Status', 'Holiday/Event', 'Casting', 'Grinding', 'MC1', 'MC2', 'MC3',
             'SP1', 'SP2', 'SP3', 'Big Line (hrs)', 'Small Line (hrs)', 'Big Line Util %', 'Small Line Util %'
         ])
 
-        for idx, row in daily.iterrows():
-            week = row.get('Week', '-')
-            date = row.get('Date', '-')
-            day = row.get('Day', '-')
-            is_holiday = row.get('Is_Holiday', 'No')
-            holiday_name = row.get('Holiday_Name', '-')
-
-            # Production quantities
-            casting = row.get('Casting_Tons', 0)
-            grinding = row.get('Grinding_Units', 0)
-            mc1 = row.get('MC1_Units', 0)
-            mc2 = row.get('MC2_Units', 0)
-            mc3 = row.get('MC3_Units', 0)
-            sp1 = row.get('SP1_Units', 0)
-            sp2 = row.get('SP2_Units', 0)
-            sp3 = row.get('SP3_Units', 0)
-            big_line_hours = row.get('Big_Line_Hours', 0)
-            small_line_hours = row.get('Small_Line_Hours', 0)
-            big_line_util = row.get('Big_Line_Util_%', 0)
-            small_line_util = row.get('Small_Line_Util_%', 0)
-
-            # Status icon
-            if is_holiday == 'Yes':
-                if 'Sunday' in str(holiday_name):
-                    status = '🔴 HOLIDAY'
-                else:
-                    status = '🔴 HOLIDAY'
-            elif day == 'Saturday':
-                status = '🟡 Saturday'
-            else:
-                status = '🟢 Working'
+        # Column defaults for sheets produced by older optimizer versions
+        daily_defaults = {
+            'Week': '-', 'Date': '-', 'Day': '-', 'Is_Holiday': 'No', 'Holiday_Name': '-',
+            'Casting_Tons': 0, 'Grinding_Units': 0, 'MC1_Units': 0, 'MC2_Units': 0, 'MC3_Units': 0,
+            'SP1_Units': 0, 'SP2_Units': 0, 'SP3_Units': 0, 'Big_Line_Hours': 0, 'Small_Line_Hours': 0,
+            'Big_Line_Util_%': 0, 'Small_Line_Util_%': 0
+        }
+        daily_view = daily.assign(**{col: default for col, default in daily_defaults.items()
+                                     if col not in daily.columns})
+
+        # Status icon, holiday label and week label for every day at once
+        is_holiday_day = daily_view['Is_Holiday'].eq('Yes').to_numpy()
+        week_num = pd.to_numeric(daily_view['Week'], errors='coerce')
+        daily_view = daily_view.assign(
+            Week_Display=np.where(week_num.notna(), 'W' + week_num.fillna(0).astype(int).astype(str), '-'),
+            Status=np.select([is_holiday_day, daily_view['Day'].eq('Saturday').to_numpy()],
+                             ['🔴 HOLIDAY', '🟡 Saturday'], default='🟢 Working'),
+            Holiday_Display=np.where(is_holiday_day, daily_view['Holiday_Name'], '-')
+        )
 
-            schedule_rows.append([
-                f'W{int(week)}' if week != '-' else '-',
-                date,
-                day,
-                status,
-                holiday_name if is_holiday == 'Yes' else '-',
-                f'{casting:.1f}' if casting > 0 else '-',
-                f'{grinding:.0f}' if grinding > 0 else '-',
-                f'{mc1:.0f}' if mc1 > 0 else '-',
-                f'{mc2:.0f}' if mc2 > 0 else '-',
-                f'{mc3:.0f}' if mc3 > 0 else '-',
-                f'{sp1:.0f}' if sp1 > 0 else '-',
-                f'{sp2:.0f}' if sp2 > 0 else '-',
-                f'{sp3:.0f}' if sp3 > 0 else '-',
-                f'{big_line_hours:.1f}' if big_line_hours else '-',
-                f'{small_line_hours:.1f}' if small_line_hours else '-',
-                f'{big_line_util:.1f}%' if big_line_util else '-',
-                f'{small_line_util:.1f}%' if small_line_util else '-'
-            ])
+        # Format every numeric column in one pass; zero/empty quantities display as '-'
+        display_formats = [
+            ('Casting_Tons', '%.1f', False), ('Grinding_Units', '%.0f', False),
+            ('MC1_Units', '%.0f', False), ('MC2_Units', '%.0f', False), ('MC3_Units', '%.0f', False),
+            ('SP1_Units', '%.0f', False), ('SP2_Units', '%.0f', False), ('SP3_Units', '%.0f', False),
+            ('Big_Line_Hours', '%.1f', True), ('Small_Line_Hours', '%.1f', True),
+            ('Big_Line_Util_%', '%.1f%%', True), ('Small_Line_Util_%', '%.1f%%', True)
+        ]
+        display_view = daily_view[['Week_Display', 'Date', 'Day', 'Status', 'Holiday_Display']].copy()
+        for col, fmt, show_nonzero in display_formats:
+            values = daily_view[col].to_numpy(dtype=float)
+            shown = values != 0 if show_nonzero else values > 0
+            display_view[col] = np.where(shown, np.char.mod(fmt, values), '-')
+
+        if not display_view.empty:
+            schedule_rows.extend(display_view.to_numpy(dtype=object).tolist())
 
         # Add weekly aggregates
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_13)
         schedule_rows.append(['WEEKLY TOTALS SUMMARY (All Weeks)', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_13)
         schedule_rows.append([
             'Week', 'Working Days', 'Holidays', 'Casting Tons', 'Grinding Units', 'MC1 Units',
             'MC2 Units', 'MC3 Units', 'SP1 Units', 'SP2 Units', 'SP3 Units',
@@ -2709,8 +2826,10 @@ class FixedExecutiveReportGenerator:
         ])
 
         if 'Week' in daily.columns:
-            weekly_grouped = daily.groupby('Week').agg({
-                'Is_Holiday': lambda x: sum(x == 'No'),  # Count working days
+            # Days are already in week order, so the group keys need no sort
+            working_flags = daily.assign(Working_Day=daily['Is_Holiday'].eq('No').astype('int8'))
+            weekly_grouped = working_flags.groupby('Week', sort=False, as_index=False, observed=True).agg({
+                'Working_Day': 'sum',  # Count working days
                 'Casting_Tons': 'sum',
                 'Grinding_Units': 'sum',
                 'MC1_Units': 'sum',
@@ -2723,31 +2842,23 @@ class FixedExecutiveReportGenerator:
                 'Small_Line_Hours': 'sum',
                 'Big_Line_Util_%': 'mean',
                 'Small_Line_Util_%': 'mean'
-            }).reset_index()
-
-            for _, wk_row in weekly_grouped.iterrows():
-                week = wk_row['Week']
-                working_days = wk_row['Is_Holiday']
-                holidays_in_week = 7 - working_days
+            })
 
-                schedule_rows.append([
-                    f'W{int(week)}',
-                    int(working_days),
-                    int(holidays_in_week),
-                    f'{wk_row["Casting_Tons"]:.1f}',
-                    f'{wk_row["Grinding_Units"]:.0f}',
-                    f'{wk_row["MC1_Units"]:.0f}',
-                    f'{wk_row["MC2_Units"]:.0f}',
-                    f'{wk_row["MC3_Units"]:.0f}',
-                    f'{wk_row["SP1_Units"]:.0f}',
-                    f'{wk_row["SP2_Units"]:.0f}',
-                    f'{wk_row["SP3_Units"]:.0f}',
-                    f'{wk_row.get("Big_Line_Hours", 0):.1f}',
-                    f'{wk_row.get("Small_Line_Hours", 0):.1f}',
-                    f'{wk_row.get("Big_Line_Util_%", 0):.1f}%',
-                    f'{wk_row.get("Small_Line_Util_%", 0):.1f}%'
-                ])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
+            working_days = weekly_grouped['Working_Day'].to_numpy(dtype=int)
+            weekly_view = pd.DataFrame({
+                'Week': 'W' + weekly_grouped['Week'].astype(int).astype(str),
+                'Working_Days': working_days,
+                'Holidays': 7 - working_days
+            })
+            for col, fmt in [('Casting_Tons', '%.1f'), ('Grinding_Units', '%.0f'),
+                             ('MC1_Units', '%.0f'), ('MC2_Units', '%.0f'), ('MC3_Units', '%.0f'),
+                             ('SP1_Units', '%.0f'), ('SP2_Units', '%.0f'), ('SP3_Units', '%.0f'),
+                             ('Big_Line_Hours', '%.1f'), ('Small_Line_Hours', '%.1f'),
+                             ('Big_Line_Util_%', '%.1f%%'), ('Small_Line_Util_%', '%.1f%%')]:
+                weekly_view[col] = np.char.mod(fmt, weekly_grouped[col].to_numpy(dtype=float))
+
+            schedule_rows.extend(weekly_view.to_numpy(dtype=object).tolist())
+        schedule_rows.append(BLANK_ROW_13)
         schedule_rows.append(['NOTES:', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['🔴 HOLIDAY = No production (Sunday or National Holiday)', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['🟡 Saturday = Working day but may have reduced shifts', '', '', '', '', '', '', '', '', '', '', '', ''])
@@ -2755,28 +2866,29 @@ class FixedExecutiveReportGenerator:
         schedule_rows.append(['Production quantities are distributed evenly across working days in each week', '', '', '', '', '', '', '', '', '', '', '', ''])
 
         if weekly_summary is not None and not weekly_summary.empty:
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_13)
             schedule_rows.append(['MOULDING LINE UTILIZATION BY WEEK', '', '', '', '', '', '', '', '', '', '', '', ''])
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_13)
             schedule_rows.append(['Week', 'Big Line Util %', 'Small Line Util %', 'Big Line Hours', 'Small Line Hours', '', '', '', '', '', '', '', ''])
-            for _, wk in weekly_summary.iterrows():
-                schedule_rows.append([
-                    f"W{int(wk['Week'])}" if not pd.isna(wk.get('Week')) else '-',
-                    f"{wk.get('Big_Line_Util_%', 0):.1f}%" if 'Big_Line_Util_%' in wk else '-',
-                    f"{wk.get('Small_Line_Util_%', 0):.1f}%" if 'Small_Line_Util_%' in wk else '-',
-                    f"{wk.get('Big_Line_Hours', 0):.1f}" if 'Big_Line_Hours' in wk else '-',
-                    f"{wk.get('Small_Line_Hours', 0):.1f}" if 'Small_Line_Hours' in wk else '-',
-                    '', '', '', '', '', '', '', ''
-                ])
-        return pd.DataFrame(schedule_rows)
+            # Resolve optional columns once; a missing column shows '-' on every week
+            line_view = pd.DataFrame(index=weekly_summary.index)
+            week_num = pd.to_numeric(weekly_summary['Week'], errors='coerce') if 'Week' in weekly_summary.columns \
+                else pd.Series(np.nan, index=weekly_summary.index)
+            line_view['Week'] = np.where(week_num.notna(), 'W' + week_num.fillna(0).astype(int).astype(str), '-')
+            for col, fmt in [('Big_Line_Util_%', '%.1f%%'), ('Small_Line_Util_%', '%.1f%%'),
+                             ('Big_Line_Hours', '%.1f'), ('Small_Line_Hours', '%.1f')]:
+                line_view[col] = (np.char.mod(fmt, weekly_summary[col].to_numpy(dtype=float))
+                                  if col in weekly_summary.columns else '-')
+            schedule_rows.extend(line_view.to_numpy(dtype=object).tolist())
+        return self._rows_to_frame(schedule_rows)
 
     def create_part_daily_schedule(self):
         """SHEET 9: PART-LEVEL DAILY SCHEDULE"""
         print("📋 Creating Part-Level Daily Schedule...")
 
-        part_daily = self.data.get('Part_Daily_Schedule', pd.DataFrame())
-        weekly_summary = self.data.get('Weekly_Summary', pd.DataFrame())
-        machines = self.data.get('Machine_Utilization', pd.DataFrame())
+        part_daily = self._get_sheet('Part_Daily_Schedule')
+        weekly_summary = self._get_sheet('Weekly_Summary')
+        machines = self._get_sheet('Machine_Utilization')
 
         if part_daily.empty:
             return pd.DataFrame([['No part-level daily schedule data available']])
@@ -2785,7 +2897,7 @@ class FixedExecutiveReportGenerator:
         schedule_rows.append(['PART-LEVEL DAILY PRODUCTION SCHEDULE - ALL 8 STAGES', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append([f'Complete production flow: Casting → Grinding → MC1 → MC2 → MC3 → SP1 → SP2 → SP3 → Delivery | Planning Period: {self.num_weeks} weeks', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['This schedule shows the ACTUAL daily production flow to determine REAL delivery dates', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
 
         # Summary statistics
         if not part_daily.empty:
@@ -2794,11 +2906,12 @@ class FixedExecutiveReportGenerator:
             total_units = part_daily['Units'].sum()
             unique_orders = part_daily['Sales_Order'].nunique() if 'Sales_Order' in part_daily.columns else 0
 
-            # Count operations
-            operation_counts = part_daily['Operation'].value_counts().to_dict()
+            # Count operations (the same grouping feeds the operation-wise summary below)
+            operation_groups = part_daily.groupby('Operation', observed=True)
+            operation_counts = operation_groups.size().to_dict()
 
             schedule_rows.append(['SCHEDULE OVERVIEW', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_14)
 
             summary_data = [
                 ['Metric', 'Value', '', '', '', '', '', '', '', '', '', '', '', ''],
@@ -2820,12 +2933,12 @@ class FixedExecutiveReportGenerator:
             ]
 
             schedule_rows.extend(summary_data)
-            schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+            schedule_rows.append(BLANK_ROW_14)
 
             if (machines is not None and 'Big_Line_Util_%' in machines.columns) or \
                (machines is not None and 'Small_Line_Util_%' in machines.columns):
                 schedule_rows.append(['MOULDING LINE CAPACITY UTILIZATION', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-                schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+                schedule_rows.append(BLANK_ROW_14)
                 schedule_rows.append(['Line', 'Avg Util %', 'Max Util %', 'Total Hours', 'Capacity Hours', '', '', '', '', '', '', '', '', ''])
 
                 if machines is not None and 'Big_Line_Util_%' in machines.columns:
@@ -2856,81 +2969,89 @@ class FixedExecutiveReportGenerator:
                         '', '', '', '', '', '', '', '', ''
                     ])
 
-                schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+                schedule_rows.append(BLANK_ROW_14)
 
         # CLEAN DATA-ONLY VIEW (no separators for Excel readability)
         schedule_rows.append(['PART-LEVEL DAILY PRODUCTION SCHEDULE - CLEAN DATA VIEW', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append([f'All production data without separator rows for easy Excel filtering/sorting | Total: {len(part_daily)} entries', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['Use "Freeze Panes" on Row 4 and Filter on "Sales Order" column to navigate by order', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_17)
         schedule_rows.append(['Date', 'Moulding Date', 'Day', 'Week', 'Part', 'Sales Order', 'Customer', 'Committed Week', 'Order Qty', 'Batch No', 'Cumulative Qty', 'Progress', 'Units', 'Operation', 'Machine/Resource', 'Unit Wt (kg)', 'Total Wt (ton)', 'Cycle Time', 'Batch Size', 'Prod Time', 'Notes'])
 
         # Show ALL entries as CLEAN DATA ROWS ONLY (no separators)
         if not part_daily.empty and 'Sales_Order' in part_daily.columns:
             # Already sorted by Sales_Order, Date, Operation in data generation
-            part_daily_sorted = part_daily.copy()
-
-            for _, row in part_daily_sorted.iterrows():
-                row_order = row.get('Sales_Order', 'N/A')
-                row_part = row.get('Part', '-')
-                row_customer = row.get('Customer', 'Unknown')
-                row_committed = row.get('Committed_Week', '-')
-                row_order_qty = row.get('Order_Qty', 0)
-                row_operation = row.get('Operation', '-')
-                row_units = int(row.get('Units', 0))
-                row_date = row.get('Date', '-')
-                row_day = row.get('Day', '-')
-                row_week = row.get('Week', '-')
-
-                # Add data row ONLY (no separators, no empty rows, no stage totals)
-                schedule_rows.append([
-                    row_date,
-                    row.get('Moulding_Date', row_date),  # NEW - Moulding Date column
-                    row_day,
-                    row_week,
-                    row_part,
-                    row_order,
-                    row_customer,
-                    row_committed,
-                    row_order_qty,
-                    int(row.get('Batch_No', 1)),  # Batch number
-                    int(row.get('Cumulative_Qty', row_units)),  # Cumulative quantity
-                    row.get('Progress', f"{row_units}/{row_order_qty}"),  # Progress indicator
-                    int(row_units),  # WHOLE NUMBER - converted to int to remove .0 suffix
-                    row_operation,
-                    row.get('Machine_Resource', 'N/A'),
-                    f"{row.get('Unit_Weight_kg', 0):.2f}",
-                    f"{row.get('Total_Weight_ton', 0):.3f}",
-                    f"{row.get('Cycle_Time_min', 0):.0f} min" if row.get('Cycle_Time_min', 0) > 0 else '-',
-                    f"{row.get('Batch_Size', 1)}",
-                    f"{row.get('Production_Time_min', 0):.0f} min" if row.get('Production_Time_min', 0) > 0 else '-',
-                    row.get('Special_Notes', '')
-                ])
+            # Fill optional columns up front so every output column can be built vectorized
+            part_daily_defaults = {
+                'Sales_Order': 'N/A', 'Part': '-', 'Customer': 'Unknown', 'Committed_Week': '-',
+                'Order_Qty': 0, 'Operation': '-', 'Units': 0, 'Date': '-', 'Day': '-', 'Week': '-',
+                'Batch_No': 1, 'Machine_Resource': 'N/A', 'Unit_Weight_kg': 0, 'Total_Weight_ton': 0,
+                'Cycle_Time_min': 0, 'Batch_Size': 1, 'Production_Time_min': 0, 'Special_Notes': ''
+            }
+            part_daily_sorted = part_daily.assign(**{col: default for col, default in part_daily_defaults.items()
+                                                      if col not in part_daily.columns})
+            if 'Moulding_Date' not in part_daily_sorted.columns:
+                part_daily_sorted['Moulding_Date'] = part_daily_sorted['Date']
+            if 'Cumulative_Qty' not in part_daily_sorted.columns:
+                part_daily_sorted['Cumulative_Qty'] = part_daily_sorted['Units']
+            if 'Progress' not in part_daily_sorted.columns:
+                part_daily_sorted['Progress'] = (part_daily_sorted['Units'].astype(int).astype(str) + '/' +
+                                                 part_daily_sorted['Order_Qty'].astype(str))
+
+            cycle_time = part_daily_sorted['Cycle_Time_min'].to_numpy(dtype=float)
+            production_time = part_daily_sorted['Production_Time_min'].to_numpy(dtype=float)
+
+            # Build the clean data view column-wise and append it as plain rows (no separators, no empty rows, no stage totals)
+            clean_view = pd.DataFrame({
+                'Date': part_daily_sorted['Date'],
+                'Moulding_Date': part_daily_sorted['Moulding_Date'],  # NEW - Moulding Date column
+                'Day': part_daily_sorted['Day'],
+                'Week': part_daily_sorted['Week'],
+                'Part': part_daily_sorted['Part'],
+                'Sales_Order': part_daily_sorted['Sales_Order'],
+                'Customer': part_daily_sorted['Customer'],
+                'Committed_Week': part_daily_sorted['Committed_Week'],
+                'Order_Qty': part_daily_sorted['Order_Qty'],
+                'Batch_No': part_daily_sorted['Batch_No'].astype(int),  # Batch number
+                'Cumulative_Qty': part_daily_sorted['Cumulative_Qty'].astype(int),  # Cumulative quantity
+                'Progress': part_daily_sorted['Progress'],  # Progress indicator
+                'Units': part_daily_sorted['Units'].astype(int),  # WHOLE NUMBER - converted to int to remove .0 suffix
+                'Operation': part_daily_sorted['Operation'],
+                'Machine_Resource': part_daily_sorted['Machine_Resource'],
+                'Unit_Weight': np.char.mod('%.2f', part_daily_sorted['Unit_Weight_kg'].to_numpy(dtype=float)),
+                'Total_Weight': np.char.mod('%.3f', part_daily_sorted['Total_Weight_ton'].to_numpy(dtype=float)),
+                'Cycle_Time': np.where(cycle_time > 0, np.char.mod('%.0f min', cycle_time), '-'),
+                'Batch_Size': part_daily_sorted['Batch_Size'].astype(str),
+                'Production_Time': np.where(production_time > 0, np.char.mod('%.0f min', production_time), '-'),
+                'Special_Notes': part_daily_sorted['Special_Notes']
+            }, index=part_daily_sorted.index)
+            schedule_rows.extend(clean_view.to_numpy(dtype=object).tolist())
         elif not part_daily.empty:
             # Fallback if Sales_Order column missing
             schedule_rows.append(['⚠ Sales Order information not available - showing date-based view', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''])
 
         # Add operation-wise summary
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['OPERATION-WISE SUMMARY (All Days)', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['Operation', 'Total Entries', 'Total Units', 'Unique Parts', 'Avg Units/Day', '', '', '', '', '', '', '', '', ''])
 
         if not part_daily.empty:
-            operation_summary = part_daily.groupby('Operation').agg({
-                'Units': ['count', 'sum', 'mean'],
-                'Part': 'nunique'
-            }).reset_index()
-
-            operation_summary.columns = ['Operation', 'Entries', 'Total_Units', 'Avg_Units', 'Unique_Parts']
-
-            for _, op_row in operation_summary.iterrows():
+            operation_summary = operation_groups.agg(
+                Entries=('Units', 'count'),
+                Total_Units=('Units', 'sum'),
+                Avg_Units=('Units', 'mean'),
+                Unique_Parts=('Part', 'nunique')
+            ).reset_index()
+
+            for operation, entries, total_units, avg_units, unique_parts in \
+                    operation_summary.itertuples(index=False, name=None):
                 schedule_rows.append([
-                    op_row['Operation'],
-                    int(op_row['Entries']),
-                    f"{op_row['Total_Units']:.0f}",
-                    int(op_row['Unique_Parts']),
-                    f"{op_row['Avg_Units']:.1f}",
+                    operation,
+                    int(entries),
+                    f"{total_units:.0f}",
+                    int(unique_parts),
+                    f"{avg_units:.1f}",
                     '',
                     '',
                     '',
@@ -2943,24 +3064,28 @@ class FixedExecutiveReportGenerator:
                 ])
 
         # Add machine utilization summary
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['MACHINE UTILIZATION SUMMARY (Top Machines)', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['Machine/Resource', 'Operations', 'Total Units', 'Total Production Time (hrs)', '', '', '', '', '', '', '', '', '', ''])
 
         if not part_daily.empty:
-            machine_summary = part_daily[part_daily['Machine_Resource'] != 'N/A'].groupby('Machine_Resource').agg({
+            # Project only the aggregated columns for the machine rows instead of copying the whole frame
+            has_machine = part_daily['Machine_Resource'].ne('N/A').to_numpy()
+            machine_rows = part_daily.loc[has_machine, ['Machine_Resource', 'Units', 'Production_Time_min', 'Operation']]
+            machine_summary = machine_rows.groupby('Machine_Resource', as_index=False, observed=True).agg({
                 'Units': 'sum',
                 'Production_Time_min': 'sum',
                 'Operation': 'count'
-            }).reset_index().sort_values('Production_Time_min', ascending=False).head(15)
+            }).nlargest(15, 'Production_Time_min')
 
-            for _, mach_row in machine_summary.iterrows():
+            for machine_resource, units, production_time, operation_count in \
+                    machine_summary.itertuples(index=False, name=None):
                 schedule_rows.append([
-                    mach_row['Machine_Resource'],
-                    int(mach_row['Operation']),
-                    f"{mach_row['Units']:.0f}",
-                    f"{mach_row['Production_Time_min'] / 60.0:.1f}",
+                    machine_resource,
+                    int(operation_count),
+                    f"{units:.0f}",
+                    f"{production_time / 60.0:.1f}",
                     '',
                     '',
                     '',
@@ -2973,18 +3098,18 @@ class FixedExecutiveReportGenerator:
                     ''
                 ])
 
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['KEY INSIGHTS - HOW TO DETERMINE ACTUAL DELIVERY DATE:', '', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['1. PRODUCTION FLOW:', 'A part must go through all 8 stages sequentially:', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['   ', 'Casting (Week X) → Grinding (Week X+1) → MC1 (Week X+2) → MC2 (Week X+3) → MC3 (Week X+4) → SP1 (Week X+5) → SP2 (Week X+6) → SP3 (Week X+7)', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['2. DELIVERY DATE:', 'A part can only be delivered AFTER completing SP3 (final painting stage)', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['   Example:', 'If SP3 completes on 2025-12-15, earliest delivery is 2025-12-15', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['3. WIP PARTS:', 'Parts already in WIP (Finished Goods, SP, MC, GR stages) skip earlier stages', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['   Example:', 'Part in MC stage skips Casting & Grinding, goes directly to MC1→MC2→MC3→SP1→SP2→SP3', '', '', '', '', '', '', '', '', '', '', '', ''])
-        schedule_rows.append(['', '', '', '', '', '', '', '', '', '', '', '', '', ''])
+        schedule_rows.append(BLANK_ROW_14)
         schedule_rows.append(['NOTES:', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['• This schedule shows EXACTLY which parts to produce each day on which machines', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['• Units are distributed evenly across working days (Mon-Sat, excluding holidays)', '', '', '', '', '', '', '', '', '', '', '', '', ''])
@@ -2992,17 +3117,10 @@ class FixedExecutiveReportGenerator:
         schedule_rows.append(['• Use this as the daily work order for the production floor', '', '', '', '', '', '', '', '', '', '', '', '', ''])
         schedule_rows.append(['• Track each part through all 8 stages to determine real delivery capability', '', '', '', '', '', '', '', '', '', '', '', '', ''])
 
-        return pd.DataFrame(schedule_rows)
+        return self._rows_to_frame(schedule_rows)
 
     def apply_enhanced_formatting(self, ws, sheet_name, df, sections=None):
         """Apply comprehensive formatting for improved readability"""
-        thin_border = Border(
-            left=Side(style='thin', color=self.colors['border_gray']),
-            right=Side(style='thin', color=self.colors['border_gray']),
-            top=Side(style='thin', color=self.colors['border_gray']),
-            bottom=Side(style='thin', color=self.colors['border_gray'])
-        )
-
         if sheet_name == '1_EXECUTIVE_DASHBOARD' and sections:
             self._format_dashboard(ws, sections)
         elif sheet_name == '7_DAILY_SCHEDULE':
@@ -3016,13 +3134,35 @@ class FixedExecutiveReportGenerator:
         else:
             self._format_standard_sheet(ws, df)
 
-        self._auto_size_columns(ws)
+        self._auto_size_columns(ws, df)
 
         if ws.max_row > 5:
             ws.freeze_panes = 'A5'
     
     def _format_dashboard(self, ws, sections):
         """Special formatting for dashboard"""
+        fonts = self.fonts
+
+        # Bind the shared style objects once; only the status fonts are specific to this sheet
+        left_center = self.alignments['left']
+        center_center = self.alignments['center']
+        title_fill = self.fills['header_dark']
+        section_fill = self.fills['header_light']
+        white_fill = self.fills['white']
+        gray_fill = self.fills['light_gray']
+        critical_fill = self.fills['critical']
+        warning_fill = self.fills['warning']
+        good_fill = self.fills['good']
+        subtitle_font = fonts['subtitle']
+        status_font_light = self._font(name='Calibri', size=10, bold=True, color='FFFFFF')
+        status_font_dark = self._font(name='Calibri', size=10, bold=True, color='000000')
+        normal_font = fonts['normal']
+        status_styles = {
+            1: (critical_fill, status_font_light),
+            2: (warning_fill, status_font_dark),
+            3: (good_fill, status_font_light)
+        }
+
         row_idx = 1
         
         for section in sections:
@@ -3032,28 +3172,26 @@ class FixedExecutiveReportGenerator:
             if section_type == 'title':
                 for col in range(1, 6):
                     cell = ws.cell(row=row_idx, column=col)
-                    cell.font = self.fonts['title']
-                    cell.fill = PatternFill(start_color=self.colors['header_dark'], 
-                                          end_color=self.colors['header_dark'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+                    cell.font = fonts['title']
+                    cell.fill = title_fill
+                    cell.alignment = left_center
                 ws.merge_cells(f'A{row_idx}:E{row_idx}')
                 row_idx += 1
             
             elif section_type == 'subtitle':
                 for col in range(1, 6):
                     cell = ws.cell(row=row_idx, column=col)
-                    cell.font = Font(name='Calibri', size=10, italic=True, color='666666')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+                    cell.font = subtitle_font
+                    cell.alignment = left_center
                 ws.merge_cells(f'A{row_idx}:E{row_idx}')
                 row_idx += 1
             
             elif section_type == 'section_header':
                 for col in range(1, 6):
                     cell = ws.cell(row=row_idx, column=col)
-                    cell.font = self.fonts['header']
-                    cell.fill = PatternFill(start_color=self.colors['header_light'], 
-                                          end_color=self.colors['header_light'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+                    cell.font = fonts['header']
+                    cell.fill = section_fill
+                    cell.alignment = left_center
                 ws.merge_cells(f'A{row_idx}:E{row_idx}')
                 ws.row_dimensions[row_idx].height = 25
                 row_idx += 1
@@ -3061,54 +3199,27 @@ class FixedExecutiveReportGenerator:
             elif section_type == 'data_table':
                 # Format header row (first row only)
                 header_row = row_idx
-                header_cell_value = ws.cell(row=header_row, column=1).value
-                print(f"      → Formatting data_table header at row {header_row}: '{header_cell_value}'")
                 for col in range(1, 6):
                     cell = ws.cell(row=header_row, column=col)
-                    cell.font = self.fonts['subheader']
-                    cell.fill = PatternFill(start_color=self.colors['light_gray'],
-                                        end_color=self.colors['light_gray'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
+                    cell.font = fonts['subheader']
+                    cell.fill = gray_fill
+                    cell.alignment = center_center
                 row_idx += 1
 
+                # Classify every data cell once: 1 = critical, 2 = warning, 3 = good, 0 = no status
+                table = pd.DataFrame(section_data[1:]).reindex(columns=range(5)).fillna('')
+                status_codes = self._status_codes(table.to_numpy(dtype=object), DASHBOARD_STATUS_PATTERNS)
+
                 # Format data rows (skip header row at index 0)
-                print(f"      → Formatting {len(section_data)-1} data rows starting at row {row_idx}")
                 for data_row_idx in range(1, len(section_data)):
-                    fill_color = self.colors['white'] if data_row_idx % 2 == 0 else self.colors['light_gray']
-                    data_cell_value = ws.cell(row=row_idx, column=1).value
-                    if data_row_idx <= 2:  # Only print first 2 data rows to avoid spam
-                        print(f"         - Data row {data_row_idx} at Excel row {row_idx}: '{data_cell_value}'")
+                    row_fill = white_fill if data_row_idx % 2 == 0 else gray_fill
                     for col in range(1, 6):
                         cell = ws.cell(row=row_idx, column=col)
 
-                        # Check if this specific cell has a status indicator
-                        has_status = False
-                        if cell.value:
-                            val_str = str(cell.value).upper()
-                            if '🔴' in val_str or 'CRITICAL' in val_str:
-                                cell.fill = PatternFill(start_color=self.colors['critical'],
-                                                       end_color=self.colors['critical'], fill_type='solid')
-                                cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                                cell.alignment = Alignment(horizontal='left', vertical='center')
-                                has_status = True
-                            elif '🟡' in val_str or 'WARNING' in val_str:
-                                cell.fill = PatternFill(start_color=self.colors['warning'],
-                                                       end_color=self.colors['warning'], fill_type='solid')
-                                cell.font = Font(name='Calibri', size=10, bold=True, color='000000')
-                                cell.alignment = Alignment(horizontal='left', vertical='center')
-                                has_status = True
-                            elif '🟢' in val_str or 'GOOD' in val_str or '✓' in val_str or 'HEALTHY' in val_str:
-                                cell.fill = PatternFill(start_color=self.colors['good'],
-                                                       end_color=self.colors['good'], fill_type='solid')
-                                cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                                cell.alignment = Alignment(horizontal='left', vertical='center')
-                                has_status = True
-
-                        # Only apply alternating row color if cell doesn't have status indicator
-                        if not has_status:
-                            cell.font = self.fonts['normal']
-                            cell.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type='solid')
-                            cell.alignment = Alignment(horizontal='left', vertical='center')
+                        # Status cells get their highlight; everything else gets the alternating row color
+                        cell.fill, cell.font = status_styles.get(status_codes[data_row_idx - 1, col - 1],
+                                                                 (row_fill, normal_font))
+                        cell.alignment = left_center
 
                     row_idx += 1
             
@@ -3119,164 +3230,152 @@ class FixedExecutiveReportGenerator:
             if section_type != 'blank':
                 row_idx += 1
     
+    @staticmethod
+    def _status_codes(values, patterns):
+        """Classify each cell of a 2-D value array: 1-based index of the first pattern found, 0 if none"""
+        text = pd.Series(values.astype(str).ravel())
+        conditions = [text.str.contains(pattern).to_numpy().reshape(values.shape) for pattern in patterns]
+        return np.select(conditions, list(range(1, len(patterns) + 1)), default=0)
+
+    def _format_title_rows(self, ws):
+        """Style the title (row 1) and subtitle (row 2) of a sheet in a single sweep"""
+        title_styles = (
+            (self.fonts['title'], self.fills['header_dark']),
+            (self.fonts['subtitle'], None)
+        )
+        left_center = self.alignments['left']
+
+        for row_cells, (font, fill) in zip(ws.iter_rows(min_row=1, max_row=min(2, ws.max_row),
+                                                        max_col=ws.max_column), title_styles):
+            for cell in row_cells:
+                cell.font = font
+                if fill is not None:
+                    cell.fill = fill
+                cell.alignment = left_center
+
+    @staticmethod
+    def _find_header_row(ws, prefix, start=4, stop=30):
+        """Return the first row in [start, stop) whose column A starts with prefix (defaults to start)"""
+        last_row = min(stop - 1, ws.max_row)
+        for row_idx, (first_cell_value,) in enumerate(ws.iter_rows(min_row=start, max_row=last_row,
+                                                                   max_col=1, values_only=True), start=start):
+            if first_cell_value and str(first_cell_value).startswith(prefix):
+                return row_idx
+        return start
+
     def _format_standard_sheet(self, ws, df):
         """Standard formatting for other sheets"""
-        for row_idx in range(1, min(4, ws.max_row + 1)):
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                if row_idx == 1:
-                    cell.font = self.fonts['title']
-                    cell.fill = PatternFill(start_color=self.colors['header_dark'], 
-                                          end_color=self.colors['header_dark'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-                elif row_idx == 2:
-                    cell.font = Font(name='Calibri', size=10, italic=True, color='666666')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+        # openpyxl recomputes the sheet bounds from every cell on each access
+        max_row, max_col = ws.max_row, ws.max_column
+        self._format_title_rows(ws)
         
         header_row = 4
-        for row_idx in range(4, min(10, ws.max_row + 1)):
+        for row_idx in range(4, min(10, max_row + 1)):
             first_cell_value = ws.cell(row=row_idx, column=1).value
             if first_cell_value and not str(first_cell_value).startswith('╔'):
                 header_row = row_idx
                 break
         
-        for col_idx in range(1, ws.max_column + 1):
+        for col_idx in range(1, max_col + 1):
             cell = ws.cell(row=header_row, column=col_idx)
             cell.font = self.fonts['subheader']
-            cell.fill = PatternFill(start_color=self.colors['header_light'], 
-                                  end_color=self.colors['header_light'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cell.fill = self.fills['header_light']
+            cell.alignment = self.alignments['center']
         
-        for row_idx in range(header_row + 1, ws.max_row + 1):
-            fill_color = self.colors['white'] if (row_idx - header_row) % 2 == 1 else self.colors['light_gray']
+        # Only two row fills and three status fonts are ever needed
+        row_fills = (
+            self.fills['light_gray'],
+            self.fills['white']
+        )
+        normal_font = self.fonts['normal']
+        critical_font = self._font(name='Calibri', size=10, bold=True, color=self.colors['critical'])
+        warning_font = self._font(name='Calibri', size=10, bold=True, color=self.colors['warning'])
+        good_font = self._font(name='Calibri', size=10, bold=True, color=self.colors['good'])
+        status_fonts = {1: critical_font, 2: warning_font, 3: good_font}
+        left_center = self.alignments['left']
+
+        # Sheet rows map 1:1 onto the source frame, so classify every cell there in one pass
+        status_codes = self._status_codes(df.to_numpy(dtype=object), STANDARD_STATUS_PATTERNS)
+
+        for row_idx, row_cells in enumerate(ws.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                                         max_col=max_col), start=header_row + 1):
+            row_fill = row_fills[(row_idx - header_row) % 2]
             
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.font = self.fonts['normal']
-                cell.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type='solid')
-                cell.alignment = Alignment(horizontal='left', vertical='center')
-                
-                if cell.value:
-                    val_str = str(cell.value).upper()
-                    if '🔴' in val_str or 'CRITICAL' in val_str:
-                        cell.font = Font(name='Calibri', size=10, bold=True, color=self.colors['critical'])
-                    elif '🟡' in val_str or 'WARNING' in val_str or '⚠' in val_str:
-                        cell.font = Font(name='Calibri', size=10, bold=True, color=self.colors['warning'])
-                    elif '🟢' in val_str or '✓' in val_str:
-                        cell.font = Font(name='Calibri', size=10, bold=True, color=self.colors['good'])
+            for cell, status_code in zip(row_cells, status_codes[row_idx - 1]):
+                cell.font = status_fonts.get(status_code, normal_font)
+                cell.fill = row_fill
+                cell.alignment = left_center
 
     def _format_daily_schedule(self, ws, df):
         """Special formatting for daily schedule with holiday highlighting"""
+        # openpyxl recomputes the sheet bounds from every cell on each access
+        max_row, max_col = ws.max_row, ws.max_column
         # Format title rows
-        for row_idx in range(1, min(4, ws.max_row + 1)):
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                if row_idx == 1:
-                    cell.font = self.fonts['title']
-                    cell.fill = PatternFill(start_color=self.colors['header_dark'],
-                                          end_color=self.colors['header_dark'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-                elif row_idx == 2:
-                    cell.font = Font(name='Calibri', size=10, italic=True, color='666666')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+        self._format_title_rows(ws)
 
         # Find header row
-        header_row = 4
-        for row_idx in range(4, min(15, ws.max_row + 1)):
-            first_cell_value = ws.cell(row=row_idx, column=1).value
-            if first_cell_value and str(first_cell_value).startswith('Week'):
-                header_row = row_idx
-                break
+        header_row = self._find_header_row(ws, 'Week', stop=15)
 
         # Format header
-        for col_idx in range(1, ws.max_column + 1):
+        for col_idx in range(1, max_col + 1):
             cell = ws.cell(row=header_row, column=col_idx)
             cell.font = self.fonts['subheader']
-            cell.fill = PatternFill(start_color=self.colors['header_light'],
-                                  end_color=self.colors['header_light'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Format data rows with holiday highlighting
-        for row_idx in range(header_row + 1, ws.max_row + 1):
-            status_cell = ws.cell(row=row_idx, column=4)  # Column D is Status
-            status_value = str(status_cell.value) if status_cell.value else ''
-
-            # Determine row color based on status
-            if '🔴' in status_value or 'HOLIDAY' in status_value.upper():
-                row_fill_color = 'FFCCCC'  # Light red for holidays
-                font_color = '990000'  # Dark red text
-                font_bold = True
-            elif '🟡' in status_value or 'SATURDAY' in status_value.upper():
-                row_fill_color = 'FFF9CC'  # Light yellow for Saturdays
-                font_color = '806600'  # Dark yellow/brown text
-                font_bold = False
-            elif '🟢' in status_value or 'WORKING' in status_value.upper():
-                row_fill_color = 'E8F5E9'  # Light green for working days
-                font_color = '1B5E20'  # Dark green text
-                font_bold = False
-            else:
-                # Default alternating rows
-                row_fill_color = self.colors['white'] if (row_idx - header_row) % 2 == 1 else self.colors['light_gray']
-                font_color = '000000'
-                font_bold = False
+            cell.fill = self.fills['header_light']
+            cell.alignment = self.alignments['center']
+
+        # Row styles: (fill, font), built once for the whole sheet
+        holiday_style = (self.fills['holiday'],  # Light red for holidays
+                         self._font(name='Calibri', size=10, bold=True, color='990000'))  # Dark red text
+        saturday_style = (self.fills['saturday'],  # Light yellow for Saturdays
+                          self._font(name='Calibri', size=10, bold=False, color='806600'))  # Dark yellow/brown text
+        working_style = (self.fills['working_day'],  # Light green for working days
+                         self._font(name='Calibri', size=10, bold=False, color='1B5E20'))  # Dark green text
+        default_font = self._font(name='Calibri', size=10, bold=False, color='000000')
+        # Indexed by row code: 0/1 = default alternating rows, 2-4 = holiday/Saturday/working
+        row_styles = (
+            (self.fills['light_gray'], default_font),
+            (self.fills['white'], default_font),
+            holiday_style,
+            saturday_style,
+            working_style
+        )
+        # Production quantity columns (numbers) start at column 6 (Casting) and are right-aligned
+        column_alignments = [self.alignments['right'] if col_idx >= 6 else self.alignments['left']
+                             for col_idx in range(1, max_col + 1)]
 
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.fill = PatternFill(start_color=row_fill_color, end_color=row_fill_color, fill_type='solid')
-                cell.font = Font(name='Calibri', size=10, bold=font_bold, color=font_color)
-                cell.alignment = Alignment(horizontal='left', vertical='center')
+        # Classify every row from the Status column (D) of the source frame in one pass
+        if df.shape[1] > 3:
+            status_codes = self._status_codes(df.iloc[:, 3:4].to_numpy(dtype=object), DAILY_STATUS_PATTERNS)[:, 0]
+        else:
+            status_codes = np.zeros(len(df), dtype=int)
+        alternating_codes = (np.arange(1, len(df) + 1) - header_row) % 2
+        row_codes = np.where(status_codes > 0, status_codes + 1, alternating_codes)
 
-                # Special formatting for production quantity columns (numbers)
-                if col_idx >= 6:  # Production columns start at column 6 (Casting)
-                    cell.alignment = Alignment(horizontal='right', vertical='center')
+        # Format data rows with holiday highlighting
+        for row_cells, row_code in zip(ws.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                                    max_col=max_col), row_codes[header_row:].tolist()):
+            row_fill, row_font = row_styles[row_code]
+            for cell, alignment in zip(row_cells, column_alignments):
+                cell.fill = row_fill
+                cell.font = row_font
+                cell.alignment = alignment
 
     def _format_part_daily_schedule(self, ws, df):
         """Special formatting for part-level daily schedule with operation color-coding"""
-        # OPTIMIZATION: Skip detailed formatting for large sheets (10,000+ rows)
-        # Only format headers to speed up generation significantly
-        if ws.max_row > 1000:
-            print(f"    ⚡ Skipping detailed formatting for {ws.max_row} rows (using fast header-only mode)")
-            # Just format the title and header row
-            for row_idx in range(1, min(30, ws.max_row + 1)):
-                first_cell_value = ws.cell(row=row_idx, column=1).value
-                if first_cell_value and 'Date' in str(first_cell_value):
-                    # Format this header row
-                    for col_idx in range(1, min(ws.max_column + 1, 20)):
-                        cell = ws.cell(row=row_idx, column=col_idx)
-                        cell.font = Font(name='Calibri', size=10, bold=True)
-                        cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-                        cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                    break
-            return  # Skip the rest of the formatting
-
-        # Format title rows (only for small sheets)
-        for row_idx in range(1, min(4, ws.max_row + 1)):
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                if row_idx == 1:
-                    cell.font = self.fonts['title']
-                    cell.fill = PatternFill(start_color=self.colors['header_dark'],
-                                          end_color=self.colors['header_dark'], fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-                elif row_idx == 2:
-                    cell.font = Font(name='Calibri', size=10, italic=True, color='666666')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+        # openpyxl recomputes the sheet bounds from every cell on each access
+        max_row, max_col = ws.max_row, ws.max_column
+        # Format title rows
+        self._format_title_rows(ws)
 
         # Find header row
-        header_row = 4
-        for row_idx in range(4, min(30, ws.max_row + 1)):
-            first_cell_value = ws.cell(row=row_idx, column=1).value
-            if first_cell_value and str(first_cell_value).startswith('Date'):
-                header_row = row_idx
-                break
+        header_row = self._find_header_row(ws, 'Date')
 
         # Format header
-        for col_idx in range(1, ws.max_column + 1):
+        for col_idx in range(1, max_col + 1):
             cell = ws.cell(row=header_row, column=col_idx)
             cell.font = self.fonts['subheader']
-            cell.fill = PatternFill(start_color=self.colors['header_light'],
-                                  end_color=self.colors['header_light'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            cell.fill = self.fills['header_light']
+            cell.alignment = self.alignments['center_wrap']
 
         # Operation colors (for visual distinction)
         operation_colors = {
@@ -3290,64 +3389,67 @@ class FixedExecutiveReportGenerator:
             'Painting_Stage3': 'F5E5FF'   # Very light purple
         }
 
-        # Format data rows with operation color-coding
-        for row_idx in range(header_row + 1, ws.max_row + 1):
-            # Get operation from column 6 (F)
-            operation_cell = ws.cell(row=row_idx, column=6)
-            operation = str(operation_cell.value) if operation_cell.value else ''
-
-            # Date separator rows (have dates in column A but are styling rows)
-            first_cell = ws.cell(row=row_idx, column=1)
-            first_val = str(first_cell.value) if first_cell.value else ''
-
-            # Check if this is a date separator row
-            is_separator = '(' in first_val and ')' in first_val and '🟢' not in first_val or '🔴' in first_val or '🟡' in first_val
-
-            if is_separator:
-                # Date separator formatting
-                for col_idx in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    cell.font = Font(name='Calibri', size=11, bold=True, color='1F4E78')
-                    cell.fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-            elif operation in operation_colors:
-                # Operation-based color coding
-                row_fill_color = operation_colors[operation]
-                for col_idx in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    cell.fill = PatternFill(start_color=row_fill_color, end_color=row_fill_color, fill_type='solid')
-                    cell.font = Font(name='Calibri', size=9)
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-
-                    # Bold part names (column 5)
-                    if col_idx == 5:
-                        cell.font = Font(name='Calibri', size=9, bold=True)
-
-                    # Right-align numeric columns
-                    if col_idx in [7, 9, 10, 12, 13]:  # Units, Unit Wt, Total Wt, Batch, Prod Time
-                        cell.alignment = Alignment(horizontal='right', vertical='center')
-            else:
-                # Default alternating rows for summary sections
-                row_fill_color = self.colors['white'] if (row_idx - header_row) % 2 == 1 else self.colors['light_gray']
-                for col_idx in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    cell.fill = PatternFill(start_color=row_fill_color, end_color=row_fill_color, fill_type='solid')
-                    cell.font = Font(name='Calibri', size=10)
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
+        separator_font = self._font(name='Calibri', size=11, bold=True, color='1F4E78')
+        separator_fill = self.fills['separator']
+        operation_font = self._font(name='Calibri', size=9)
+        part_font = self._font(name='Calibri', size=9, bold=True)
+        summary_font = self._font(name='Calibri', size=10)
+        left_center = self.alignments['left']
+        right_center = self.alignments['right']
+        right_aligned_cols = frozenset((7, 9, 10, 12, 13))
+        columns = range(1, max_col + 1)
+
+        # Row style table, indexed by row code:
+        # 0/1 = alternating summary rows, 2 = date separator, 3+ = one per operation
+        style_table = [
+            [(summary_font, self.fills['light_gray'], left_center)] * len(columns),
+            [(summary_font, self.fills['white'], left_center)] * len(columns),
+            [(separator_font, separator_fill, left_center)] * len(columns)
+        ]
+        operation_codes = {}
+        for operation, color in operation_colors.items():
+            operation_codes[operation] = len(style_table)
+            operation_fill = self._fill(color)
+            style_table.append([
+                (part_font if col_idx == 5 else operation_font,
+                 operation_fill,
+                 right_center if col_idx in right_aligned_cols else left_center)
+                for col_idx in columns
+            ])
+
+        # Sheet rows map 1:1 onto the source frame, so classify every row there in one pass:
+        # separators by column A text, operation rows by column F, everything else alternates
+        first_values = df.iloc[:, 0].where(df.iloc[:, 0].astype(bool), '').astype(str)
+        is_separator = first_values.str.contains(SEPARATOR_PATTERN).to_numpy()
+        if df.shape[1] > 5:
+            operation_row_codes = df.iloc[:, 5].map(operation_codes).fillna(-1).to_numpy(dtype=np.int8)
+        else:
+            operation_row_codes = np.full(len(df), -1, dtype=np.int8)
+        summary_codes = ((np.arange(1, len(df) + 1) - header_row) % 2).astype(np.int8)
+        row_codes = np.where(is_separator, 2,
+                             np.where(operation_row_codes >= 0, operation_row_codes, summary_codes))
+
+        # Format data rows: one table lookup per row, then plain per-cell assignment
+        for row_cells, row_code in zip(ws.iter_rows(min_row=header_row + 1, max_row=max_row,
+                                                    max_col=max_col), row_codes[header_row:].tolist()):
+            for cell, (font, fill, alignment) in zip(row_cells, style_table[row_code]):
+                cell.font = font
+                cell.fill = fill
+                cell.alignment = alignment
 
     def create_daily_production_tracker(self):
         """Create daily production tracker sheet using DailyProductionInventoryTracker."""
         print("  📊 Creating Daily Production Tracker...")
 
         # Get Part_Daily_Schedule data
-        part_daily = self.data.get('Part_Daily_Schedule', pd.DataFrame())
+        part_daily = self._get_sheet('Part_Daily_Schedule')
 
         if part_daily.empty:
             print("    ⚠ No Part_Daily_Schedule data available for production tracker")
             return pd.DataFrame({'Note': ['No daily schedule data available']})
 
         # Get WIP initial data
-        wip_initial = self.data.get('WIP_Initial', pd.DataFrame())
+        wip_initial = self._get_sheet('WIP_Initial')
 
         # Create tracker
         tracker = DailyProductionInventoryTracker(
@@ -3372,14 +3474,14 @@ class FixedExecutiveReportGenerator:
         print("  📊 Creating Daily Inventory Tracker...")
 
         # Get Part_Daily_Schedule data
-        part_daily = self.data.get('Part_Daily_Schedule', pd.DataFrame())
+        part_daily = self._get_sheet('Part_Daily_Schedule')
 
         if part_daily.empty:
             print("    ⚠ No Part_Daily_Schedule data available for inventory tracker")
             return pd.DataFrame({'Note': ['No daily schedule data available']})
 
         # Get WIP initial data
-        wip_initial = self.data.get('WIP_Initial', pd.DataFrame())
+        wip_initial = self._get_sheet('WIP_Initial')
 
         # Create tracker
         tracker = DailyProductionInventoryTracker(
@@ -3421,9 +3523,9 @@ class FixedExecutiveReportGenerator:
         ws.insert_rows(1)
 
         # Header formatting
-        header_fill = PatternFill(start_color='1F4788', end_color='1F4788', fill_type='solid')
-        subheader_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_font = Font(color='FFFFFF', bold=True, size=10)
+        header_fill = self.fills['header_dark']
+        subheader_fill = self.fills['tracker_subheader']
+        header_font = self._font(color='FFFFFF', bold=True, size=10)
 
         # Row 1: Part names (merged across stages)
         # Row 2: Stage labels (CS, GR, MC, SP or FG, SP, MC, GR, CS)
@@ -3459,148 +3561,181 @@ class FixedExecutiveReportGenerator:
             ws.cell(row=1, column=col_idx, value='Total')
             ws.merge_cells(start_row=1, start_column=col_idx, end_row=2, end_column=col_idx)
 
+        # Header cells are all in place now; read the sheet bounds once
+        max_row, max_col = ws.max_row, ws.max_column
+
         # Apply header formatting to rows 1 and 2
-        for col in range(1, ws.max_column + 1):
+        for col in range(1, max_col + 1):
             cell1 = ws.cell(row=1, column=col)
             cell2 = ws.cell(row=2, column=col)
 
             cell1.fill = header_fill
             cell1.font = header_font
-            cell1.alignment = Alignment(horizontal='center', vertical='center')
+            cell1.alignment = self.alignments['center']
 
             cell2.fill = subheader_fill
             cell2.font = header_font
-            cell2.alignment = Alignment(horizontal='center', vertical='center')
+            cell2.alignment = self.alignments['center']
 
         # Data formatting (rows 3+)
-        for row in range(3, ws.max_row + 1):
+        row_fills = (
+            self.fills['white'],
+            self.fills['light_gray']
+        )
+        data_font = self._font(name='Calibri', size=9)
+        left_center = self.alignments['left']
+        right_center = self.alignments['right']
+
+        for row in range(3, max_row + 1):
             # Alternate row colors
-            row_fill = PatternFill(
-                start_color='F8F9FA' if row % 2 == 1 else 'FFFFFF',
-                end_color='F8F9FA' if row % 2 == 1 else 'FFFFFF',
-                fill_type='solid'
-            )
+            row_fill = row_fills[row % 2]
 
-            for col in range(1, ws.max_column + 1):
+            for col in range(1, max_col + 1):
                 cell = ws.cell(row=row, column=col)
                 cell.fill = row_fill
-                cell.font = Font(name='Calibri', size=9)
+                cell.font = data_font
 
                 # Left align Date and Week, right align numbers
-                if col <= 2:
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-                else:
-                    cell.alignment = Alignment(horizontal='right', vertical='center')
+                cell.alignment = left_center if col <= 2 else right_center
 
         # Set column widths
         ws.column_dimensions['A'].width = 12  # Date
         ws.column_dimensions['B'].width = 6   # Week
 
         # Set width for part columns (narrower for matrix format)
-        for col in range(3, ws.max_column + 1):
+        for col in range(3, max_col + 1):
             col_letter = get_column_letter(col)
             ws.column_dimensions[col_letter].width = 6
 
         # Freeze panes (freeze Date, Week columns and header rows)
         ws.freeze_panes = 'C3'
 
-    def _auto_size_columns(self, ws):
-        """Auto-size columns with maximum width"""
-        for col_num in range(1, ws.max_column + 1):
-            max_length = 0
-            column_letter = None
-
-            for row_num in range(1, ws.max_row + 1):
-                cell = ws.cell(row=row_num, column=col_num)
-
-                if isinstance(cell, type(ws.cell(1, 1))):
-                    if column_letter is None:
-                        column_letter = cell.column_letter
+    def _auto_size_columns(self, ws, df):
+        """Auto-size columns with maximum width, measured on the DataFrame the sheet was written from"""
+        from openpyxl.utils import get_column_letter
 
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
+        if df.empty:
+            lengths = np.zeros(1, dtype=int)
+        else:
+            # Blank cells (missing, '', 0) do not count towards the width, as when reading them back
+            values = df.to_numpy(dtype=object)
+            filled = pd.notna(values) & (values != '') & (values != 0)
+            lengths = np.where(filled, np.char.str_len(values.astype(str)), 0).max(axis=0)
 
-            if column_letter:
-                adjusted_width = min(max_length + 3, 60)
-                ws.column_dimensions[column_letter].width = adjusted_width
+        for col_num, max_length in enumerate(lengths, start=1):
+            ws.column_dimensions[get_column_letter(col_num)].width = min(int(max_length) + 3, 60)
     
+    @staticmethod
+    def _append_frame_rows(ws, df):
+        """Append DataFrame values to a worksheet row by row (no header/index, missing values left blank)"""
+        if df.empty:
+            return
+        values = df.to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        for row in values.tolist():
+            ws.append(row)
+
+    def _log(self, message=''):
+        """Queue a progress line; queued lines are written together by _flush_log"""
+        self._log_buf.append(f"{message}\n")
+
+    def _flush_log(self):
+        """Write all queued progress lines to stdout in one call"""
+        if self._log_buf:
+            sys.stdout.write(''.join(self._log_buf))
+            sys.stdout.flush()
+            self._log_buf.clear()
+
     def generate_executive_report(self, output_path):
         """Main method to generate FIXED executive report with ALL 8 stages"""
         
-        print("\n" + "="*80)
-        print("GENERATING FIXED EXECUTIVE 10-SHEET REPORT")
-        print("NOW SHOWS ALL 8 PRODUCTION STAGES + DAILY TRACKERS")
-        print("="*80 + "\n")
+        self._log("\n" + "="*80)
+        self._log("GENERATING FIXED EXECUTIVE 10-SHEET REPORT")
+        self._log("NOW SHOWS ALL 8 PRODUCTION STAGES + DAILY TRACKERS")
+        self._log("="*80 + "\n")
+        self._flush_log()
         
         self.load_detailed_data()
         
-        print("\n📊 Creating FIXED sheets with ALL 8 stages...\n")
-
-        dashboard_df, dashboard_sections = self.create_executive_dashboard()
-        master_schedule_df = self.create_master_schedule()
-        delivery_tracker_df = self.create_delivery_tracker()
-        bottleneck_alerts_df = self.create_bottleneck_alerts()
-        capacity_overview_df = self.create_capacity_overview()
-        material_flow_df = self.create_material_flow()
-        # gantt_timeline_df = self.create_gantt_timeline()  # REMOVED per user request
-        daily_schedule_df = self.create_daily_schedule()
-        part_daily_schedule_df = self.create_part_daily_schedule()
-        daily_production_df = self.create_daily_production_tracker()
-        daily_inventory_df = self.create_daily_inventory_tracker()
-
-        sheets = {
-            '1_EXECUTIVE_DASHBOARD': (dashboard_df, dashboard_sections),
-            '2_MASTER_SCHEDULE': (master_schedule_df, None),
-            '3_DELIVERY_TRACKER': (delivery_tracker_df, None),
-            '4_BOTTLENECK_ALERTS': (bottleneck_alerts_df, None),
-            '5_CAPACITY_OVERVIEW': (capacity_overview_df, None),
-            '6_MATERIAL_FLOW': (material_flow_df, None),
-            '7_DAILY_SCHEDULE': (daily_schedule_df, None),
-            '8_PART_DAILY_SCHEDULE': (part_daily_schedule_df, None),
-            '9_DAILY_PRODUCTION': (daily_production_df, None),
-            '10_DAILY_INVENTORY': (daily_inventory_df, None)
-        }
-        
-        print(f"\n💾 Writing FIXED report to: {output_path}")
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for sheet_name, (df, sections) in sheets.items():
+        self._log("\n📊 Creating FIXED sheets with ALL 8 stages...\n")
+        self._flush_log()
+
+        # Sheet builders only read self.data, so build them concurrently
+        # (pandas reductions release the GIL while they run)
+        sheet_builders = [
+            ('1_EXECUTIVE_DASHBOARD', self.create_executive_dashboard),
+            ('2_MASTER_SCHEDULE', self.create_master_schedule),
+            ('3_DELIVERY_TRACKER', self.create_delivery_tracker),
+            ('4_BOTTLENECK_ALERTS', self.create_bottleneck_alerts),
+            ('5_CAPACITY_OVERVIEW', self.create_capacity_overview),
+            ('6_MATERIAL_FLOW', self.create_material_flow),
+            # ('GANTT_TIMELINE', self.create_gantt_timeline),  # REMOVED per user request
+            ('7_DAILY_SCHEDULE', self.create_daily_schedule),
+            ('8_PART_DAILY_SCHEDULE', self.create_part_daily_schedule),
+            ('9_DAILY_PRODUCTION', self.create_daily_production_tracker),
+            ('10_DAILY_INVENTORY', self.create_daily_inventory_tracker)
+        ]
+
+        self._log(f"\n💾 Writing FIXED report to: {output_path}")
+        # Build the workbook in memory and format it before the single save,
+        # rather than writing it with pandas and reloading the file to style it
+        self.wb = Workbook()
+        self.wb.remove(self.wb.active)
+        formatted_lines = []
+        with ThreadPoolExecutor(max_workers=min(8, len(sheet_builders))) as executor:
+            futures = [(sheet_name, executor.submit(builder)) for sheet_name, builder in sheet_builders]
+            # Write and format each sheet as soon as its frame is ready, then let the frame go,
+            # so at most the sheets still being built are held in memory alongside the workbook
+            while futures:
+                sheet_name, future = futures.pop(0)
+                df, sections = future.result(), None
+                del future
+                if sheet_name == '1_EXECUTIVE_DASHBOARD':
+                    df, sections = df
+
                 # All sheets written without headers - formatting adds custom headers
-                df.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
-                print(f"  ✓ Created: {sheet_name}")
-        
-        print("\n🎨 Applying enhanced formatting...")
-        self.wb = load_workbook(output_path)
-        
-        for sheet_name, (df, sections) in sheets.items():
-            ws = self.wb[sheet_name]
-            self.apply_enhanced_formatting(ws, sheet_name, df, sections)
-            print(f"  ✓ Formatted: {sheet_name}")
+                ws = self.wb.create_sheet(sheet_name)
+                self._append_frame_rows(ws, df)
+                self._log(f"  ✓ Created: {sheet_name}")
+
+                # Formatting stays sequential: assigning a style registers it in workbook-wide
+                # style tables that openpyxl does not guard, so concurrent formatters could
+                # corrupt style indices (and the cell loops hold the GIL anyway)
+                self.apply_enhanced_formatting(ws, sheet_name, df, sections)
+                formatted_lines.append(f"  ✓ Formatted: {sheet_name}")
+                del df, sections
+
+        self._log("\n🎨 Applying enhanced formatting...")
+        for line in formatted_lines:
+            self._log(line)
         
         self.wb.save(output_path)
         
-        print("\n" + "="*80)
-        print("✅ FIXED EXECUTIVE REPORT GENERATED SUCCESSFULLY!")
-        print("="*80)
-        print(f"\n📁 Output: {output_path}")
-        print(f"📊 Sheets: 10 executive-level sheets (including Daily Trackers)")
-        print("\n🎯 FEATURES:")
-        print("   ✓ ALL 8 stages now visible in Executive Dashboard")
-        print("   ✓ Casting, Grinding, MC1, MC2, MC3, SP1, SP2, SP3")
-        print("   ✓ Proper capacity calculations for each stage")
-        print("   ✓ Individual utilization percentages")
-        print("   ✓ Complete bottleneck analysis")
-        print("   ✓ Full capacity overview across all stages")
-        print("   ✓ Daily Schedule with calendar dates and holidays")
-        print("   ✓ Part-Level Daily Schedule with machine assignments")
-        print("   ✓ Daily Production Tracker (Date × Part-Stage matrix)")
-        print("   ✓ Daily Inventory Tracker (Date × Part-WIP matrix)\n")
+        self._log("\n" + "="*80)
+        self._log("✅ FIXED EXECUTIVE REPORT GENERATED SUCCESSFULLY!")
+        self._log("="*80)
+        self._log(f"\n📁 Output: {output_path}")
+        self._log(f"📊 Sheets: 10 executive-level sheets (including Daily Trackers)")
+        self._log("\n🎯 FEATURES:")
+        self._log("   ✓ ALL 8 stages now visible in Executive Dashboard")
+        self._log("   ✓ Casting, Grinding, MC1, MC2, MC3, SP1, SP2, SP3")
+        self._log("   ✓ Proper capacity calculations for each stage")
+        self._log("   ✓ Individual utilization percentages")
+        self._log("   ✓ Complete bottleneck analysis")
+        self._log("   ✓ Full capacity overview across all stages")
+        self._log("   ✓ Daily Schedule with calendar dates and holidays")
+        self._log("   ✓ Part-Level Daily Schedule with machine assignments")
+        self._log("   ✓ Daily Production Tracker (Date × Part-Stage matrix)")
+        self._log("   ✓ Daily Inventory Tracker (Date × Part-WIP matrix)\n")
+        self._flush_log()
 
 
 def main():
     """Generate FIXED executive report with Master Data enrichment"""
+    parser = argparse.ArgumentParser(description='Generate the executive report from the comprehensive plan')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate even if the report is newer than its inputs')
+    args = parser.parse_args()
 
     detailed_output = 'production_plan_comprehensive_test.xlsx'
     executive_output = 'production_plan_EXECUTIVE_test.xlsx'
@@ -3615,6 +3750,14 @@ def main():
     print(f"Master: {master_data} (Part Master with machines, weights, cycle times)")
     print(f"Output: {executive_output} (10 sheets - ENRICHED)")
     print(f"Start Date: {start_date.strftime('%Y-%m-%d')}\n")
+
+    # Nothing to do if the report was written after both inputs last changed
+    inputs = [detailed_output, master_data]
+    if (not args.force and os.path.exists(executive_output)
+            and all(os.path.exists(path) for path in inputs)
+            and os.path.getmtime(executive_output) > max(os.path.getmtime(path) for path in inputs)):
+        print(f"✅ {executive_output} is up to date (use --force to regenerate)")
+        return
     
     generator = FixedExecutiveReportGenerator(detailed_output, start_date=start_date, master_data_path=master_data)
     generator.generate_executive_report(executive_output)
@@ -28,9 +28,11 @@ Usage:
 """
 
 import pandas as pd
+import numpy as np
 import pulp
 from datetime import datetime, timedelta
 import math
+import os
 from collections import defaultdict
 import warnings
 import re
@@ -38,6 +40,50 @@ from pulp import PULP_CBC_CMD
 import holidays
 warnings.filterwarnings('ignore')
 
+# Part-level daily schedule: part master keys (resource, cycle time, batch size) used by each stage.
+# Casting runs on the part's moulding line.
+STAGE_PART_INFO_KEYS = {
+    'Casting': ('moulding_line', 'casting_cycle', 'casting_batch'),
+    'Grinding': ('grinding_resource', 'grinding_cycle', 'grinding_batch'),
+    'Machining_Stage1': ('mc1_resource', 'mc1_cycle', 'mc1_batch'),
+    'Machining_Stage2': ('mc2_resource', 'mc2_cycle', 'mc2_batch'),
+    'Machining_Stage3': ('mc3_resource', 'mc3_cycle', 'mc3_batch'),
+    'Painting_Stage1': ('sp1_resource', 'sp1_cycle', 'sp1_batch'),
+    'Painting_Stage2': ('sp2_resource', 'sp2_cycle', 'sp2_batch'),
+    'Painting_Stage3': ('sp3_resource', 'sp3_cycle', 'sp3_batch')
+}
+
+# Part Master columns read for the part-level daily schedule: key -> (column, default if the column is missing)
+PART_MASTER_INFO_COLUMNS = {
+    'moulding_line': ('Moulding Line', 'N/A'),
+    'grinding_resource': ('Grinding Resource code', 'N/A'),
+    'mc1_resource': ('Machining resource code 1', 'N/A'),
+    'mc2_resource': ('Machining resource code 2', 'N/A'),
+    'mc3_resource': ('Machining resource code 3', 'N/A'),
+    'sp1_resource': ('Painting Resource code 1', 'N/A'),
+    'sp2_resource': ('Painting Resource code 2', 'N/A'),
+    'sp3_resource': ('Painting Resource code 3', 'N/A'),
+    'casting_cycle': ('Casting Cycle time (min)', 0),
+    'grinding_cycle': ('Grinding Cycle time (min)', 0),
+    'mc1_cycle': ('Machining Cycle time 1 (min)', 0),
+    'mc2_cycle': ('Machining Cycle time 2 (min)', 0),
+    'mc3_cycle': ('Machining Cycle time 3 (min)', 0),
+    'sp1_cycle': ('Painting Cycle time 1 (min)', 0),
+    'sp2_cycle': ('Painting Cycle time 2 (min)', 0),
+    'sp3_cycle': ('Painting Cycle time 3 (min)', 0),
+    'casting_batch': ('Casting Batch Qty', 1),
+    'grinding_batch': ('Grinding batch Qty', 1),
+    'mc1_batch': ('Machining batch Qty 1', 1),
+    'mc2_batch': ('Machining batch Qty 2', 1),
+    'mc3_batch': ('Machining batch Qty 3', 1),
+    'sp1_batch': ('Painting batch Qty 1', 1),
+    'sp2_batch': ('Painting batch Qty 2', 1),
+    'sp3_batch': ('Painting batch Qty 3', 1),
+    'unit_weight': ('Standard unit wt.', 0),
+    'vacuum_time': ('Vacuum Time (hrs)', 0),
+    'box_size': ('Box Size', 'N/A')
+}
+
 
 class ProductionConfig:
     """Comprehensive configuration with all parameters."""
@@ -89,6 +135,11 @@ class ProductionConfig:
         self.STARTUP_BONUS = -50
         self.SETUP_PENALTY = 5  # Setup changeover penalty
 
+        # Solver settings (CBC)
+        self.SOLVER_THREADS = os.cpu_count() or 8  # Parallel branch-and-bound threads
+        self.SOLVER_GAP_REL = 0.01  # Stop once within 1% of the best bound
+        self.SOLVER_TIME_LIMIT = 120  # Seconds
+
         # Daily scheduling parameters
         self.WEEKLY_OFF_DAY = 6  # Sunday (0=Monday, 6=Sunday)
         self.COUNTRY_CODE = 'IN'  # India
@@ -101,31 +152,71 @@ class ProductionCalendar:
     def __init__(self, config):
         self.config = config
         self.india_holidays = holidays.India(years=range(2025, 2028))
+        # Plain date -> name snapshot of the holiday table, for lookups without key normalization
+        self._holiday_names = dict(self.india_holidays)
+        # Working dates per (start date, week number); the week layout never changes once computed
+        self._working_days_cache = {}
+        # Whole-horizon day tables per (start date, number of weeks)
+        self._horizon_cache = {}
 
     def get_working_days_in_week(self, week_num):
         """Get list of working dates for a given week number"""
-        week_start = self.config.CURRENT_DATE + timedelta(weeks=week_num - 1)
+        cache_key = (self.config.CURRENT_DATE, week_num)
+        cached = self._working_days_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-        # Generate all 7 days of the week
-        all_days = [week_start + timedelta(days=i) for i in range(7)]
-
-        working_days = []
-        for day in all_days:
-            # Skip Sunday (day 6)
-            if day.weekday() == self.config.WEEKLY_OFF_DAY:
-                continue
-            # Skip national holidays
-            if day in self.india_holidays:
-                continue
-            working_days.append(day)
+        # Skip Sunday (day 6) and national holidays
+        working_days = [day for day, is_working, _ in self.get_week_days(week_num) if is_working]
 
+        self._working_days_cache[cache_key] = tuple(working_days)
         return working_days
 
+    def get_week_days(self, week_num):
+        """Get all 7 days of a week as (date, is_working, holiday_name) tuples"""
+        week_start = self.config.CURRENT_DATE + timedelta(weeks=week_num - 1)
+
+        week_days = []
+        for i in range(7):
+            day = week_start + timedelta(days=i)
+            holiday_name = self.get_holiday_name(day)
+            week_days.append((day, holiday_name is None, holiday_name))
+        return week_days
+
+    def get_national_holiday_name(self, date):
+        """Get the national holiday name for a date (or datetime), None if it is not a holiday"""
+        day = date.date() if isinstance(date, datetime) else date
+        if day.year not in self.india_holidays.years:
+            # holidays.India fills in a new year on first lookup; refresh the snapshot after it does
+            self.india_holidays.get(day)
+            self._holiday_names = dict(self.india_holidays)
+        return self._holiday_names.get(day)
+
+    def get_horizon_calendar(self, num_weeks):
+        """Day-by-day calendar for weeks 1..num_weeks, computed with array operations.
+
+        Returns a DataFrame with one row per day: Date, Week, Is_Weekly_Off,
+        National_Holiday (holiday name or None) and Is_Working.
+        """
+        cache_key = (self.config.CURRENT_DATE, num_weeks)
+        if cache_key not in self._horizon_cache:
+            dates = pd.date_range(self.config.CURRENT_DATE, periods=num_weeks * 7, freq='D')
+            is_weekly_off = dates.weekday == self.config.WEEKLY_OFF_DAY
+            national_holidays = np.array([self.get_national_holiday_name(day) for day in dates.date], dtype=object)
+            self._horizon_cache[cache_key] = pd.DataFrame({
+                'Date': dates,
+                'Week': np.arange(len(dates)) // 7 + 1,  # day i falls in week i // 7 + 1
+                'Is_Weekly_Off': is_weekly_off,
+                'National_Holiday': national_holidays,
+                'Is_Working': ~(is_weekly_off | pd.notna(national_holidays))
+            })
+        return self._horizon_cache[cache_key].copy()
+
     def is_working_day(self, date):
         """Check if a date is a working day"""
         if date.weekday() == self.config.WEEKLY_OFF_DAY:
             return False
-        if date in self.india_holidays:
+        if self.get_national_holiday_name(date) is not None:
             return False
         return True
 
@@ -133,9 +224,7 @@ class ProductionCalendar:
         """Get holiday name if date is a holiday"""
         if date.weekday() == self.config.WEEKLY_OFF_DAY:
             return "Sunday - Weekly Off"
-        if date in self.india_holidays:
-            return self.india_holidays.get(date)
-        return None
+        return self.get_national_holiday_name(date)
 
     def distribute_weekly_to_daily(self, weekly_qty, week_num):
         """Distribute weekly quantity across working days"""
@@ -162,105 +251,72 @@ class DailyScheduleGenerator:
         self.results_dict = results_dict
         self.config = config
         self.calendar = ProductionCalendar(config)
+        # Day-by-day calendar shared by both schedules, and its working days for quick joins
+        self.calendar_df = self._build_calendar_df()
+        self.working_calendar_df = self.calendar_df[self.calendar_df['Is_Holiday'] == 'No']
+
+    def _build_calendar_df(self):
+        """Build the planning-horizon calendar: one row per day with its display columns"""
+        horizon = self.calendar.get_horizon_calendar(self.config.PLANNING_WEEKS)
+        dates = pd.DatetimeIndex(horizon['Date'])
+        is_weekly_off = horizon['Is_Weekly_Off'].to_numpy()
+        national_holidays = horizon['National_Holiday'].to_numpy()
+        is_working = horizon['Is_Working'].to_numpy()
+
+        holiday_names = np.where(is_working, '', None).astype(object)
+        holiday_names[is_weekly_off] = "Sunday - Weekly Off"
+        national_only = pd.notna(national_holidays) & ~is_weekly_off
+        holiday_names[national_only] = national_holidays[national_only]
+
+        return pd.DataFrame({
+            'Week': horizon['Week'].to_numpy(),
+            'Date': dates.strftime('%Y-%m-%d'),
+            'Day': dates.strftime('%A'),
+            'Day_Num': dates.day.astype('int64'),
+            'Month': dates.strftime('%B'),
+            'Is_Holiday': np.where(is_working, 'No', 'Yes'),
+            'Holiday_Name': holiday_names,
+            'Status': np.select([~is_working, dates.weekday == 5],  # 5 = Saturday
+                                ['🔴 HOLIDAY', '🟡 Saturday'], '🟢 Working')
+        })
 
     def generate_daily_schedule(self):
         """Generate complete daily schedule for ALL planning weeks"""
-        daily_rows = []
-
-        # Process ALL weeks in planning horizon, not just those in weekly_summary
-        for week_num in range(1, self.config.PLANNING_WEEKS + 1):
-            # Get weekly quantities from weekly_summary if available, otherwise 0
-            week_data = self.weekly_summary[self.weekly_summary['Week'] == week_num]
-
-            if len(week_data) > 0:
-                week_row = week_data.iloc[0]
-                weekly_casting = week_row.get('Casting_Tons', 0)
-                weekly_grinding = week_row.get('Grinding_Units', 0)
-                weekly_mc1 = week_row.get('MC1_Units', 0)
-                weekly_mc2 = week_row.get('MC2_Units', 0)
-                weekly_mc3 = week_row.get('MC3_Units', 0)
-                weekly_sp1 = week_row.get('SP1_Units', 0)
-                weekly_sp2 = week_row.get('SP2_Units', 0)
-                weekly_sp3 = week_row.get('SP3_Units', 0)
-                weekly_delivery = week_row.get('Delivery_Units', 0)
-                weekly_big_line_hours = week_row.get('Big_Line_Hours', 0)
-                weekly_small_line_hours = week_row.get('Small_Line_Hours', 0)
-                weekly_big_line_util = week_row.get('Big_Line_Util_%', 0)
-                weekly_small_line_util = week_row.get('Small_Line_Util_%', 0)
-            else:
-                # Week not in weekly_summary - use zeros (buffer weeks)
-                weekly_casting = weekly_grinding = weekly_mc1 = weekly_mc2 = weekly_mc3 = 0
-                weekly_sp1 = weekly_sp2 = weekly_sp3 = weekly_delivery = 0
-                weekly_big_line_hours = weekly_small_line_hours = 0
-                weekly_big_line_util = weekly_small_line_util = 0
-
-            working_days = self.calendar.get_working_days_in_week(week_num)
-            num_working_days = len(working_days)
-
-            # Distribute evenly across working days (even if quantities are 0)
-            if num_working_days > 0:
-                for day_date in working_days:
-                    daily_rows.append({
-                        'Week': week_num,
-                        'Date': day_date.strftime('%Y-%m-%d'),
-                        'Day': day_date.strftime('%A'),
-                        'Day_Num': day_date.day,
-                        'Month': day_date.strftime('%B'),
-                        'Is_Holiday': 'No',
-                        'Holiday_Name': '',
-                        'Casting_Tons': weekly_casting / num_working_days if num_working_days > 0 else 0,
-                        'Grinding_Units': weekly_grinding / num_working_days if num_working_days > 0 else 0,
-                        'MC1_Units': weekly_mc1 / num_working_days if num_working_days > 0 else 0,
-                        'MC2_Units': weekly_mc2 / num_working_days if num_working_days > 0 else 0,
-                        'MC3_Units': weekly_mc3 / num_working_days if num_working_days > 0 else 0,
-                        'SP1_Units': weekly_sp1 / num_working_days if num_working_days > 0 else 0,
-                        'SP2_Units': weekly_sp2 / num_working_days if num_working_days > 0 else 0,
-                        'SP3_Units': weekly_sp3 / num_working_days if num_working_days > 0 else 0,
-                        'Delivery_Units': weekly_delivery / num_working_days if num_working_days > 0 else 0,
-                        'Big_Line_Hours': weekly_big_line_hours / num_working_days if num_working_days > 0 else 0,
-                        'Small_Line_Hours': weekly_small_line_hours / num_working_days if num_working_days > 0 else 0,
-                        'Big_Line_Util_%': weekly_big_line_util,
-                        'Small_Line_Util_%': weekly_small_line_util
-                    })
+        planning_weeks = self.config.PLANNING_WEEKS
 
-            # Add holiday rows for visibility
-            week_start = self.config.CURRENT_DATE + timedelta(weeks=week_num - 1)
-            all_days = [week_start + timedelta(days=i) for i in range(7)]
-
-            for day in all_days:
-                if not self.calendar.is_working_day(day):
-                    holiday_name = self.calendar.get_holiday_name(day)
-                    daily_rows.append({
-                        'Week': week_num,
-                        'Date': day.strftime('%Y-%m-%d'),
-                        'Day': day.strftime('%A'),
-                        'Day_Num': day.day,
-                        'Month': day.strftime('%B'),
-                        'Is_Holiday': 'Yes',
-                        'Holiday_Name': holiday_name,
-                        'Casting_Tons': 0,
-                        'Grinding_Units': 0,
-                        'MC1_Units': 0,
-                        'MC2_Units': 0,
-                        'MC3_Units': 0,
-                        'SP1_Units': 0,
-                        'SP2_Units': 0,
-                        'SP3_Units': 0,
-                        'Delivery_Units': 0,
-                        'Big_Line_Hours': 0,
-                        'Small_Line_Hours': 0,
-                        'Big_Line_Util_%': weekly_big_line_util,
-                        'Small_Line_Util_%': weekly_small_line_util
-                    })
+        # One row per calendar day of the horizon
+        daily_schedule = self.calendar_df.drop(columns='Status')
+        weeks = daily_schedule['Week'].to_numpy()
+        is_working = (daily_schedule['Is_Holiday'] == 'No').to_numpy()
+        num_working_days = np.bincount(weeks, weights=is_working, minlength=planning_weeks + 1)[weeks]
+
+        # Weekly quantities for ALL weeks in the horizon; weeks not in weekly_summary are zeros (buffer weeks)
+        weekly = (self.weekly_summary.drop_duplicates('Week')
+                  .set_index('Week')
+                  .reindex(range(1, planning_weeks + 1), fill_value=0))
+
+        def weekly_values(col):
+            if col not in weekly.columns:
+                return np.zeros(len(weeks), dtype=int)
+            return weekly[col].to_numpy()[weeks - 1]
+
+        # Distribute weekly quantities evenly across working days; non-working days get 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for col in ['Casting_Tons', 'Grinding_Units', 'MC1_Units', 'MC2_Units', 'MC3_Units',
+                        'SP1_Units', 'SP2_Units', 'SP3_Units', 'Delivery_Units',
+                        'Big_Line_Hours', 'Small_Line_Hours']:
+                daily_schedule[col] = np.where(is_working, weekly_values(col) / num_working_days, 0)
 
-        return pd.DataFrame(daily_rows).sort_values(['Date'])
+        # Utilization is a weekly figure, repeated on every day of the week
+        for col in ['Big_Line_Util_%', 'Small_Line_Util_%']:
+            daily_schedule[col] = weekly_values(col)
+
+        return daily_schedule
 
     def generate_part_level_daily_schedule(self, part_master_df):
         """Generate part-level daily production schedule with machine assignments"""
         print("Generating part-level daily schedule...")
 
-        part_daily_rows = []
-
         # Stage mapping
         stages = {
             'Casting': 'casting_plan',
@@ -273,41 +329,25 @@ class DailyScheduleGenerator:
             'Painting_Stage3': 'sp3_plan'
         }
 
-        # Create part master lookup
-        part_master_dict = {}
-        if not part_master_df.empty:
-            for _, row in part_master_df.iterrows():
-                part_code = row.get('FG Code', row.get('Item Code', None))
-                if part_code:
-                    part_master_dict[part_code] = {
-                        'moulding_line': row.get('Moulding Line', 'N/A'),
-                        'grinding_resource': row.get('Grinding Resource code', 'N/A'),
-                        'mc1_resource': row.get('Machining resource code 1', 'N/A'),
-                        'mc2_resource': row.get('Machining resource code 2', 'N/A'),
-                        'mc3_resource': row.get('Machining resource code 3', 'N/A'),
-                        'sp1_resource': row.get('Painting Resource code 1', 'N/A'),
-                        'sp2_resource': row.get('Painting Resource code 2', 'N/A'),
-                        'sp3_resource': row.get('Painting Resource code 3', 'N/A'),
-                        'casting_cycle': row.get('Casting Cycle time (min)', 0),
-                        'grinding_cycle': row.get('Grinding Cycle time (min)', 0),
-                        'mc1_cycle': row.get('Machining Cycle time 1 (min)', 0),
-                        'mc2_cycle': row.get('Machining Cycle time 2 (min)', 0),
-                        'mc3_cycle': row.get('Machining Cycle time 3 (min)', 0),
-                        'sp1_cycle': row.get('Painting Cycle time 1 (min)', 0),
-                        'sp2_cycle': row.get('Painting Cycle time 2 (min)', 0),
-                        'sp3_cycle': row.get('Painting Cycle time 3 (min)', 0),
-                        'casting_batch': row.get('Casting Batch Qty', 1),
-                        'grinding_batch': row.get('Grinding batch Qty', 1),
-                        'mc1_batch': row.get('Machining batch Qty 1', 1),
-                        'mc2_batch': row.get('Machining batch Qty 2', 1),
-                        'mc3_batch': row.get('Machining batch Qty 3', 1),
-                        'sp1_batch': row.get('Painting batch Qty 1', 1),
-                        'sp2_batch': row.get('Painting batch Qty 2', 1),
-                        'sp3_batch': row.get('Painting batch Qty 3', 1),
-                        'unit_weight': row.get('Standard unit wt.', 0),
-                        'vacuum_time': row.get('Vacuum Time (hrs)', 0),
-                        'box_size': row.get('Box Size', 'N/A')
-                    }
+        # Create part master lookup: one row per part code (later rows win), with the
+        # default used for any Part Master column that is missing
+        part_code_col = next((col for col in ('FG Code', 'Item Code') if col in part_master_df.columns), None)
+        if part_master_df.empty or part_code_col is None:
+            part_info = pd.DataFrame()
+        else:
+            part_info = pd.DataFrame({
+                key: part_master_df[col] if col in part_master_df.columns else default
+                for key, (col, default) in PART_MASTER_INFO_COLUMNS.items()
+            })
+            part_info.index = part_master_df[part_code_col]
+            part_info = part_info[part_master_df[part_code_col].map(bool).to_numpy()]
+            part_info = part_info[~part_info.index.duplicated(keep='last')]
+
+        # Working dates of each week, with their display columns
+        days = self.working_calendar_df[['Week', 'Date', 'Day', 'Status']].rename(columns={'Week': 'Week_Num'})
+        num_working_days = days.groupby('Week_Num').size()
+
+        stage_frames = []
 
         # Process each stage
         for stage_name, plan_key in stages.items():
@@ -316,111 +356,97 @@ class DailyScheduleGenerator:
             if stage_plan.empty:
                 continue
 
-            # Group by part and week
-            for (part, week), group in stage_plan.groupby(['Part', 'Week']):
-                week_num = int(week)
-                total_units = group['Units'].sum()
-
-                if total_units < 0.1:
-                    continue
-
-                # Get working days for this week
-                working_days = self.calendar.get_working_days_in_week(week_num)
-                num_working_days = len(working_days)
+            # Machine/resource assignment
+            resource_key, cycle_key, batch_key = STAGE_PART_INFO_KEYS[stage_name]
+
+            # Total units per part and week; weight, line and vacuum flag come from the group's first row
+            group_keys = ['Part', 'Week']
+            first_cols = [col for col in ['Unit_Weight_kg', 'Moulding_Line', 'Requires_Vacuum']
+                          if col in stage_plan.columns]
+            part_weeks = (stage_plan.groupby(group_keys)['Units'].sum().to_frame('Total_Units')
+                          .join(stage_plan.drop_duplicates(group_keys).set_index(group_keys)[first_cols])
+                          .reset_index())
+            part_weeks = part_weeks[part_weeks['Total_Units'] >= 0.1]
+            if part_weeks.empty:
+                continue
+            part_weeks['Week_Num'] = part_weeks['Week'].astype(int)
 
-                if num_working_days == 0:
-                    continue
+            # Get part metadata
+            known_part = part_weeks['Part'].isin(part_info.index).to_numpy()
+            part_rows = part_info.reindex(part_weeks['Part'])
 
-                # Daily units (evenly distributed)
-                daily_units = total_units / num_working_days
-
-                # Get part metadata
-                part_info = part_master_dict.get(part, {})
-                unit_weight = group['Unit_Weight_kg'].iloc[0] if not group.empty else part_info.get('unit_weight', 0)
-                moulding_line = group['Moulding_Line'].iloc[0] if not group.empty and 'Moulding_Line' in group.columns else part_info.get('moulding_line', 'N/A')
-                requires_vacuum = group['Requires_Vacuum'].iloc[0] if not group.empty and 'Requires_Vacuum' in group.columns else False
-
-                # Machine/resource assignment
-                if stage_name == 'Casting':
-                    machine_resource = moulding_line
-                    cycle_time = part_info.get('casting_cycle', 0)
-                    batch_size = part_info.get('casting_batch', 1)
-                elif stage_name == 'Grinding':
-                    machine_resource = part_info.get('grinding_resource', 'N/A')
-                    cycle_time = part_info.get('grinding_cycle', 0)
-                    batch_size = part_info.get('grinding_batch', 1)
-                elif stage_name == 'Machining_Stage1':
-                    machine_resource = part_info.get('mc1_resource', 'N/A')
-                    cycle_time = part_info.get('mc1_cycle', 0)
-                    batch_size = part_info.get('mc1_batch', 1)
-                elif stage_name == 'Machining_Stage2':
-                    machine_resource = part_info.get('mc2_resource', 'N/A')
-                    cycle_time = part_info.get('mc2_cycle', 0)
-                    batch_size = part_info.get('mc2_batch', 1)
-                elif stage_name == 'Machining_Stage3':
-                    machine_resource = part_info.get('mc3_resource', 'N/A')
-                    cycle_time = part_info.get('mc3_cycle', 0)
-                    batch_size = part_info.get('mc3_batch', 1)
-                elif stage_name == 'Painting_Stage1':
-                    machine_resource = part_info.get('sp1_resource', 'N/A')
-                    cycle_time = part_info.get('sp1_cycle', 0)
-                    batch_size = part_info.get('sp1_batch', 1)
-                elif stage_name == 'Painting_Stage2':
-                    machine_resource = part_info.get('sp2_resource', 'N/A')
-                    cycle_time = part_info.get('sp2_cycle', 0)
-                    batch_size = part_info.get('sp2_batch', 1)
-                elif stage_name == 'Painting_Stage3':
-                    machine_resource = part_info.get('sp3_resource', 'N/A')
-                    cycle_time = part_info.get('sp3_cycle', 0)
-                    batch_size = part_info.get('sp3_batch', 1)
-                else:
-                    machine_resource = 'N/A'
-                    cycle_time = 0
-                    batch_size = 1
-
-                # Create entry for each working day
-                for day_date in working_days:
-                    # Calculate production time
-                    production_time_min = 0
-                    if cycle_time > 0 and batch_size > 0:
-                        num_batches = daily_units / batch_size
-                        production_time_min = num_batches * cycle_time
-
-                    # Special notes
-                    notes = []
-                    if requires_vacuum and stage_name == 'Casting':
-                        notes.append('Vacuum Required')
-                    if part_info.get('vacuum_time', 0) > 0:
-                        notes.append(f"Vacuum Time: {part_info['vacuum_time']:.1f} hrs")
-
-                    part_daily_rows.append({
-                        'Date': day_date.strftime('%Y-%m-%d'),
-                        'Day': day_date.strftime('%A'),
-                        'Week': f'W{week_num}',
-                        'Status': self._get_day_status(day_date),
-                        'Part': part,
-                        'Operation': stage_name,
-                        'Units': round(daily_units, 2),
-                        'Machine_Resource': machine_resource if pd.notna(machine_resource) else 'N/A',
-                        'Unit_Weight_kg': round(unit_weight, 2),
-                        'Total_Weight_ton': round(daily_units * unit_weight / 1000.0, 3),
-                        'Cycle_Time_min': round(cycle_time, 1),
-                        'Batch_Size': int(batch_size) if pd.notna(batch_size) else 1,
-                        'Production_Time_min': round(production_time_min, 1),
-                        'Special_Notes': '; '.join(notes) if notes else ''
-                    })
-
-        print(f"  Generated {len(part_daily_rows)} part-level daily entries")
-        return pd.DataFrame(part_daily_rows).sort_values(['Date', 'Operation', 'Part'])
+            def part_values(key, default):
+                if key not in part_rows.columns:
+                    return pd.Series(default, index=part_weeks.index, dtype=object)
+                return pd.Series(np.where(known_part, part_rows[key].to_numpy(dtype=object), default),
+                                 index=part_weeks.index, dtype=object)
 
-    def _get_day_status(self, date):
-        """Get status indicator for a date"""
-        if not self.calendar.is_working_day(date):
-            return '🔴 HOLIDAY'
-        elif date.weekday() == 5:  # Saturday
-            return '🟡 Saturday'
-        else:
-            return '🟢 Working'
+            if stage_name == 'Casting' and 'Moulding_Line' in part_weeks.columns:
+                machine_resource = part_weeks['Moulding_Line'].astype(object)
+            else:
+                machine_resource = part_values(resource_key, 'N/A')
+            cycle_time = part_values(cycle_key, 0)
+            batch_size = part_values(batch_key, 1)
+            vacuum_time = part_values('vacuum_time', 0)
+            requires_vacuum = (part_weeks['Requires_Vacuum'].astype(bool) if 'Requires_Vacuum' in part_weeks.columns
+                               else pd.Series(False, index=part_weeks.index))
+
+            # Special notes
+            vacuum_notes = [f"Vacuum Time: {value:.1f} hrs" if value > 0 else '' for value in vacuum_time]
+            if stage_name == 'Casting':
+                part_weeks['Special_Notes'] = [
+                    '; '.join(note for note in ('Vacuum Required' if required else '', vacuum_note) if note)
+                    for required, vacuum_note in zip(requires_vacuum, vacuum_notes)
+                ]
+            else:
+                part_weeks['Special_Notes'] = vacuum_notes
+
+            part_weeks['Machine_Resource'] = machine_resource.fillna('N/A')
+            part_weeks['Cycle_Time'] = cycle_time.astype(float)
+            part_weeks['Cycle_Time_min'] = [round(value, 1) for value in cycle_time]
+            part_weeks['Batch'] = batch_size.astype(float)
+            part_weeks['Batch_Size'] = pd.to_numeric(batch_size).fillna(1).astype('int64')
+
+            # Create entry for each working day (weeks without working days drop out of the merge)
+            stage_daily = part_weeks.merge(days, on='Week_Num')
+            daily_units = stage_daily['Total_Units'] / stage_daily['Week_Num'].map(num_working_days)
+            unit_weight = stage_daily['Unit_Weight_kg']
+
+            # Calculate production time
+            has_time = (stage_daily['Cycle_Time'] > 0) & (stage_daily['Batch'] > 0)
+            if has_time.any():
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    production_time_min = np.round(np.where(
+                        has_time, daily_units / stage_daily['Batch'] * stage_daily['Cycle_Time'], 0), 1)
+            else:
+                production_time_min = 0
+
+            stage_frames.append(pd.DataFrame({
+                'Date': stage_daily['Date'],
+                'Day': stage_daily['Day'],
+                'Week': 'W' + stage_daily['Week_Num'].astype(str),
+                'Status': stage_daily['Status'],
+                'Part': stage_daily['Part'],
+                'Operation': stage_name,
+                'Units': daily_units.round(2),
+                'Machine_Resource': stage_daily['Machine_Resource'],
+                'Unit_Weight_kg': unit_weight.round(2),
+                'Total_Weight_ton': (daily_units * unit_weight / 1000.0).round(3),
+                'Cycle_Time_min': stage_daily['Cycle_Time_min'],
+                'Batch_Size': stage_daily['Batch_Size'],
+                'Production_Time_min': production_time_min,
+                'Special_Notes': stage_daily['Special_Notes']
+            }))
+
+        if not stage_frames:
+            print("  Generated 0 part-level daily entries")
+            return pd.DataFrame(columns=['Date', 'Day', 'Week', 'Status', 'Part', 'Operation', 'Units',
+                                         'Machine_Resource', 'Unit_Weight_kg', 'Total_Weight_ton',
+                                         'Cycle_Time_min', 'Batch_Size', 'Production_Time_min', 'Special_Notes'])
+
+        part_daily_schedule = pd.concat(stage_frames, ignore_index=True)
+        print(f"  Generated {len(part_daily_schedule)} part-level daily entries")
+        return part_daily_schedule.sort_values(['Date', 'Operation', 'Part'])
 
 
 class ComprehensiveDataLoader:
@@ -436,11 +462,14 @@ class ComprehensiveDataLoader:
         print("LOADING DATA")
         print("="*80)
         
-        self.part_master = pd.read_excel(self.file_path, sheet_name='Part Master')
-        self.sales_order = pd.read_excel(self.file_path, sheet_name='Sales Order')
-        self.machine_constraints = pd.read_excel(self.file_path, sheet_name='Machine Constraints')
-        self.stage_wip = pd.read_excel(self.file_path, sheet_name='Stage WIP')
-        self.box_capacity = pd.read_excel(self.file_path, sheet_name='Mould Box Capacity')
+        # Read all sheets in one pass so the workbook is only opened and parsed once
+        sheets = pd.read_excel(self.file_path, sheet_name=['Part Master', 'Sales Order', 'Machine Constraints',
+                                                           'Stage WIP', 'Mould Box Capacity'])
+        self.part_master = sheets['Part Master']
+        self.sales_order = sheets['Sales Order']
+        self.machine_constraints = sheets['Machine Constraints']
+        self.stage_wip = sheets['Stage WIP']
+        self.box_capacity = sheets['Mould Box Capacity']
         
         print(f"✓ Part Master: {len(self.part_master)} parts")
         print(f"✓ Sales Orders: {len(self.sales_order)} order lines")
@@ -480,9 +509,8 @@ class ComprehensiveDataLoader:
             valid_dates = self.sales_order['Delivery_Date'].notna().sum()
             print(f"\n✓ Delivery dates: {valid_dates}/{len(self.sales_order)} valid")
             
-            missing_mask = self.sales_order['Delivery_Date'].isna()
-            self.sales_order.loc[missing_mask, 'Delivery_Date'] = (
-                self.config.CURRENT_DATE + timedelta(weeks=3)
+            self.sales_order['Delivery_Date'] = self.sales_order['Delivery_Date'].fillna(
+                pd.Timestamp(self.config.CURRENT_DATE + timedelta(weeks=3))
             )
     
     def _process_wip_data(self):
@@ -492,10 +520,12 @@ class ComprehensiveDataLoader:
         if 'CastingItem' in self.stage_wip.columns:
             # ✅ FIX: Use Part Master as source of truth for CS → FG mapping
             # This correctly maps CS1-KBS-001 → KBS-01 (not KBS-001)
-            cs_to_fg_mapping = dict(zip(
-                self.part_master['CS Code'],
-                self.part_master['FG Code']
-            ))
+            # Both codes are stripped like CastingItem; for a repeated CS Code the last row wins
+            cs_to_fg_mapping = pd.Series(
+                self.part_master['FG Code'].str.strip().to_numpy(),
+                index=self.part_master['CS Code'].str.strip()
+            )
+            cs_to_fg_mapping = cs_to_fg_mapping[~cs_to_fg_mapping.index.duplicated(keep='last')]
 
             # Map CS codes to FG codes correctly
             self.stage_wip['Material Code'] = (
@@ -528,8 +558,10 @@ class ComprehensiveDataLoader:
         # Get valid parts from Part Master
         valid_parts = set(self.part_master['FG Code'].str.strip().str.upper())
 
-        # Get ordered parts
-        ordered_parts = set(self.sales_order['Material Code'].str.strip().str.upper())
+        # Get ordered parts (upper-cased codes are normalized once and reused below)
+        material_codes_upper = self.sales_order['Material Code'].str.upper()
+        material_codes = material_codes_upper.str.strip()
+        ordered_parts = set(material_codes)
 
         # Find missing parts
         missing_parts = ordered_parts - valid_parts
@@ -537,14 +569,14 @@ class ComprehensiveDataLoader:
         if missing_parts:
             print(f"\n⚠️  WARNING: Found {len(missing_parts)} part(s) in orders NOT in Part Master:")
 
-            missing_details = []
-            for part in sorted(missing_parts):
-                orders = self.sales_order[
-                    self.sales_order['Material Code'].str.upper() == part
-                ]
-                total_qty = orders['Balance Qty'].sum()
-                order_count = len(orders)
+            # Order lines and quantity per missing part, in one pass over the sales orders
+            missing_mask = material_codes.isin(missing_parts)
+            missing_summary = (self.sales_order.loc[missing_mask, 'Balance Qty']
+                               .groupby(material_codes[missing_mask])
+                               .agg(['size', 'sum']))
 
+            missing_details = []
+            for part, order_count, total_qty in missing_summary.itertuples(name=None):
                 missing_details.append({
                     'Part': part,
                     'Order_Lines': order_count,
@@ -559,9 +591,7 @@ class ComprehensiveDataLoader:
 
             # Filter out invalid parts from sales orders
             original_count = len(self.sales_order)
-            self.sales_order = self.sales_order[
-                self.sales_order['Material Code'].str.upper().isin(valid_parts)
-            ]
+            self.sales_order = self.sales_order[material_codes_upper.isin(valid_parts)]
             filtered_count = original_count - len(self.sales_order)
 
             print(f"\n  → Filtered out {filtered_count} order line(s) for invalid parts")
@@ -585,13 +615,16 @@ class ComprehensiveDataLoader:
             print("\n⚠️  No delivery dates found, using default 10 weeks")
             return 10
 
-        # Find latest order delivery date
+        # Delivery week of every order (Week 1 = days 0-6 from the start date), kept for downstream use
+        self.sales_order['Delivery_Week'] = (
+            (self.sales_order['Delivery_Date'] - self.config.CURRENT_DATE).dt.days // 7 + 1
+        ).astype('int64')
+
+        # Find earliest and latest order delivery date and week
         latest_order = self.sales_order['Delivery_Date'].max()
         earliest_order = self.sales_order['Delivery_Date'].min()
-
-        # Calculate week numbers from start
-        days_to_latest = (latest_order - self.config.CURRENT_DATE).days
-        latest_week = max(1, int(days_to_latest / 7) + 1)
+        latest_week = max(1, int(self.sales_order['Delivery_Week'].max()))
+        earliest_week = int(self.sales_order['Delivery_Week'].min())
 
         # Add buffer for early production capability (can produce ahead and store)
         planning_weeks = latest_week + self.config.PLANNING_BUFFER_WEEKS
@@ -609,7 +642,7 @@ class ComprehensiveDataLoader:
         print("DYNAMIC PLANNING HORIZON CALCULATION")
         print("="*80)
         print(f"📅 Sales Order Date Range:")
-        print(f"   Earliest: {earliest_order.strftime('%Y-%m-%d')} (Week {int((earliest_order - self.config.CURRENT_DATE).days / 7) + 1})")
+        print(f"   Earliest: {earliest_order.strftime('%Y-%m-%d')} (Week {earliest_week})")
         print(f"   Latest:   {latest_order.strftime('%Y-%m-%d')} (Week {latest_week})")
         print(f"\n📊 Planning Horizon:")
         print(f"   Planning Weeks: {planning_weeks} weeks (ALL orders optimized together)")
@@ -626,27 +659,26 @@ class ComprehensiveDataLoader:
 
 def build_wip_init(stage_wip: pd.DataFrame) -> dict:
     """Build initial WIP by part and stage for flow constraints."""
-    wip_init = defaultdict(lambda: {'FG':0,'SP':0,'MC':0,'GR':0,'CS':0})
-    if 'Material Code' in stage_wip.columns:
-        for _, row in stage_wip.iterrows():
-            part = str(row['Material Code']).strip()
-            if not part or part == 'nan':
-                continue
-            wip_init[part]['FG'] += int(row.get('FG', 0) or 0)
-            wip_init[part]['SP'] += int(row.get('SP', 0) or 0)
-            wip_init[part]['MC'] += int(row.get('MC', 0) or 0)
-            wip_init[part]['GR'] += int(row.get('GR', 0) or 0)
-            wip_init[part]['CS'] += int(row.get('CS', 0) or 0)
-    return dict(wip_init)
+    if 'Material Code' not in stage_wip.columns:
+        return {}
+    stage_cols = ['FG', 'SP', 'MC', 'GR', 'CS']
+    wip = stage_wip.reindex(columns=['Material Code'] + stage_cols, fill_value=0)
+    parts = wip['Material Code'].astype(str).str.strip()
+    valid = parts.ne('') & parts.ne('nan')
+    # Quantities are truncated to whole units per row before summing
+    quantities = wip.loc[valid, stage_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+    return quantities.groupby(parts[valid], sort=False).sum().to_dict('index')
 
 
 class WIPDemandCalculator:
     """Calculate net demand with stage-wise WIP skip logic."""
     
-    def __init__(self, sales_order, stage_wip, config):
+    def __init__(self, sales_order, stage_wip, config, wip_init=None):
         self.sales_order = sales_order
         self.stage_wip = stage_wip
         self.config = config
+        # Per-part WIP totals; pass the model's wip_init to share one aggregation of stage_wip
+        self.wip_init = wip_init if wip_init is not None else build_wip_init(stage_wip)
     
     def calculate_net_demand_with_stages(self):
         """Calculate demand considering WIP at EACH stage."""
@@ -660,75 +692,66 @@ class WIPDemandCalculator:
         }).to_dict()['Balance Qty']
         
         # Get WIP by part and stage
-        wip_by_part = {}
-        if 'Material Code' in self.stage_wip.columns:
-            for _, row in self.stage_wip.iterrows():
-                part = str(row['Material Code']).strip()
-                if not part or part == 'nan':
-                    continue
-                wip_by_part[part] = {
-                    'FG': int(row.get('FG', 0) or 0),
-                    'SP': int(row.get('SP', 0) or 0),
-                    'MC': int(row.get('MC', 0) or 0),
-                    'GR': int(row.get('GR', 0) or 0),
-                    'CS': int(row.get('CS', 0) or 0)
-                }
-        
-        # Calculate stage-wise requirements
-        stage_start_qty = {}
-        wip_coverage = defaultdict(lambda: defaultdict(int))
-        net_demand = {}
-        
-        for part, gross in gross_demand.items():
-            wip = wip_by_part.get(part, {})
-            remaining_delivery = int(gross or 0)
-            
-            # Satisfy from FG
-            fg_used = min(wip.get('FG', 0), remaining_delivery)
-            remaining_delivery -= fg_used
-            wip_coverage[part]['FG'] = fg_used
-            
-            # Satisfy from SP
-            sp_used = min(wip.get('SP', 0), remaining_delivery)
-            remaining_delivery -= sp_used
-            wip_coverage[part]['SP'] = sp_used
-            
-            net_to_produce = remaining_delivery
-            
-            # Determine how many units need NEW production at each stage
-            # Flow: Casting → Grinding → Machining → Painting → Delivery
-            # WIP at each stage reduces upstream production needs
-
-            painting_start = net_to_produce  # Units needing painting
-
-            # MC WIP enters at painting, skipping machining
-            mc_skip = min(wip.get('MC', 0), painting_start)
-            wip_coverage[part]['MC'] = mc_skip
-            machining_start = painting_start - mc_skip  # Units needing machining
-
-            # GR WIP enters at machining, skipping grinding
-            gr_skip = min(wip.get('GR', 0), machining_start)
-            wip_coverage[part]['GR'] = gr_skip
-            grinding_start = machining_start - gr_skip  # Units needing grinding
-
-            # CS WIP enters at grinding, skipping casting
-            cs_skip = min(wip.get('CS', 0), grinding_start)
-            wip_coverage[part]['CS'] = cs_skip
-            casting_start = grinding_start - cs_skip  # Units needing casting
-            
-            stage_start_qty[part] = {
+        wip_by_part = self.wip_init
+        
+        # Calculate stage-wise requirements for all parts at once (parts without WIP get zeros)
+        parts = list(gross_demand)
+        wip = (pd.DataFrame.from_dict(wip_by_part, orient='index', columns=['FG', 'SP', 'MC', 'GR', 'CS'])
+               .reindex(parts, fill_value=0)
+               .astype('int64'))
+        remaining_delivery = pd.Series(list(gross_demand.values()), dtype=float).fillna(0).to_numpy(dtype='int64')
+
+        # Satisfy from FG
+        fg_used = np.minimum(wip['FG'].to_numpy(), remaining_delivery)
+        remaining_delivery = remaining_delivery - fg_used
+
+        # Satisfy from SP
+        sp_used = np.minimum(wip['SP'].to_numpy(), remaining_delivery)
+        remaining_delivery = remaining_delivery - sp_used
+
+        net_to_produce = remaining_delivery
+
+        # Determine how many units need NEW production at each stage
+        # Flow: Casting → Grinding → Machining → Painting → Delivery
+        # WIP at each stage reduces upstream production needs
+
+        painting_start = net_to_produce  # Units needing painting
+
+        # MC WIP enters at painting, skipping machining
+        mc_skip = np.minimum(wip['MC'].to_numpy(), painting_start)
+        machining_start = painting_start - mc_skip  # Units needing machining
+
+        # GR WIP enters at machining, skipping grinding
+        gr_skip = np.minimum(wip['GR'].to_numpy(), machining_start)
+        grinding_start = machining_start - gr_skip  # Units needing grinding
+
+        # CS WIP enters at grinding, skipping casting
+        cs_skip = np.minimum(wip['CS'].to_numpy(), grinding_start)
+        casting_start = grinding_start - cs_skip  # Units needing casting
+
+        net_demand = dict(zip(parts, net_to_produce.tolist()))
+        stage_start_qty = {
+            part: {
                 'gross': gross,
-                'net': net_to_produce,
-                'casting': casting_start,
-                'grinding': grinding_start,
-                'machining': machining_start,
-                'painting': painting_start
+                'net': net,
+                'casting': casting,
+                'grinding': grinding,
+                'machining': machining,
+                'painting': painting
             }
-            
-            net_demand[part] = net_to_produce
-        
+            for part, gross, net, casting, grinding, machining, painting in zip(
+                parts, gross_demand.values(), net_to_produce.tolist(), casting_start.tolist(),
+                grinding_start.tolist(), machining_start.tolist(), painting_start.tolist())
+        }
+        # WIP used per part (rows) and stage (FG, SP, MC, GR, CS columns)
+        coverage = np.column_stack([fg_used, sp_used, mc_skip, gr_skip, cs_skip])
+        wip_coverage = {
+            part: dict(zip(['FG', 'SP', 'MC', 'GR', 'CS'], covered))
+            for part, covered in zip(parts, coverage.tolist())
+        }
+
         total_gross = sum(gross_demand.values())
-        total_wip = sum(sum(stage.values()) for stage in wip_coverage.values())
+        total_wip = int(coverage.sum())
         total_net = sum(net_demand.values())
         
         print(f"\n✓ Gross Demand: {total_gross:,.0f} units")
@@ -751,15 +774,12 @@ class WIPDemandCalculator:
         # Preserve integer weekly order quantities first
         # Include all orders even if net=0 (WIP fully covers demand)
         # so that WIP can still be delivered
-        for _, row in self.sales_order.iterrows():
-            part = row['Material Code']
-            qty = row['Balance Qty']
-            delivery_date = row['Delivery_Date']
-
+        order_rows = zip(self.sales_order['Material Code'], self.sales_order['Balance Qty'],
+                         self._get_week_numbers(self.sales_order['Delivery_Date']))
+        for part, qty, week_num in order_rows:
             if (qty or 0) <= 0:
                 continue
             
-            week_num = self._get_week_number(delivery_date)
             variant = f"{part}_W{week_num}"
             gross_split[variant] = gross_split.get(variant, 0) + int(qty)
             part_week_mapping[variant] = (part, week_num)
@@ -769,53 +789,47 @@ class WIPDemandCalculator:
             )
         
         # Consume WIP against earliest due weeks to maintain integer allocations
-        variants_by_part = defaultdict(list)
-        for variant, (part, week) in part_week_mapping.items():
-            variants_by_part[part].append((variant, week, gross_split[variant]))
-        
-        adjusted_split = {}
-        for part, variants in variants_by_part.items():
-            variants.sort(key=lambda x: (x[1], x[0]))
-            gross_part = sum(q for _, _, q in variants)
-            net_part = max(0, net_demand.get(part, gross_part))
-            wip_used = max(0, gross_part - net_part)
-            wip_remaining = wip_used
-
-            # Track if any variant kept for this part
-            part_has_variant = False
-
-            for variant, week, qty in variants:
-                original_qty = qty
-                if wip_remaining > 0:
-                    wip_take = min(wip_remaining, qty)
-                    qty -= wip_take
-                    wip_remaining -= wip_take
-
-                if qty > 0:
-                    adjusted_split[variant] = qty
-                    part_week_mapping[variant] = (part, week)
-                    part_has_variant = True
-                elif not part_has_variant and original_qty > 0:
-                    # Keep at least one variant for WIP delivery even if net=0
-                    # Use original_qty as demand (will be fulfilled from WIP)
-                    adjusted_split[variant] = original_qty
-                    part_week_mapping[variant] = (part, week)
-                    part_has_variant = True
-                else:
-                    part_week_mapping.pop(variant, None)
-                    variant_windows.pop(variant, None)
+        # (parts in first-seen order, each part's variants by week)
+        variants = pd.DataFrame(
+            [(variant, part, week, gross_split[variant]) for variant, (part, week) in part_week_mapping.items()],
+            columns=['Variant', 'Part', 'Week', 'Qty']
+        )
+        variants['Part_Order'] = pd.factorize(variants['Part'], use_na_sentinel=False)[0]
+        variants = variants.sort_values(['Part_Order', 'Week', 'Variant'])
+        qty = variants['Qty'].astype('int64')
+        qty_by_part = qty.groupby(variants['Part_Order'], sort=False)
+
+        gross_part = qty_by_part.transform('sum')
+        net_part = variants['Part'].map(net_demand).fillna(gross_part).clip(lower=0)
+        wip_used = (gross_part - net_part).clip(lower=0)
+
+        # WIP left for a variant is what the part's earlier weeks have not already taken
+        wip_take = (wip_used - (qty_by_part.cumsum() - qty)).clip(lower=0, upper=qty)
+        adjusted_qty = (qty - wip_take).astype('int64')
+
+        # Keep at least one variant for WIP delivery even if net=0: the part's earliest ordered
+        # variant keeps its original_qty as demand (will be fulfilled from WIP)
+        has_qty = qty > 0
+        first_ordered = has_qty & has_qty.groupby(variants['Part_Order']).cumsum().eq(1)
+        kept = (adjusted_qty > 0) | first_ordered
+        kept_qty = adjusted_qty.where(adjusted_qty > 0, qty)
+
+        adjusted_split = dict(zip(variants.loc[kept, 'Variant'], kept_qty[kept].tolist()))
+        for variant in variants.loc[~kept, 'Variant']:
+            part_week_mapping.pop(variant, None)
+            variant_windows.pop(variant, None)
         
         print(f"  Created {len(adjusted_split)} part-week variants")
         
         return adjusted_split, part_week_mapping, variant_windows
 
-    def _get_week_number(self, delivery_date):
-        """Calculate week number from delivery date."""
-        if pd.isna(delivery_date):
-            return self.config.PLANNING_WEEKS // 2
-        days_diff = (delivery_date - self.config.CURRENT_DATE).days
-        week_num = max(1, (days_diff // 7) + 1)  # Week 1 = days 0-6, Week 2 = days 7-13, etc.
-        return week_num
+    def _get_week_numbers(self, delivery_dates):
+        """Calculate week numbers for a Series of delivery dates (missing dates fall mid-horizon)."""
+        days_diff = (delivery_dates - self.config.CURRENT_DATE).dt.days
+        week_nums = (days_diff // 7 + 1).clip(lower=1)  # Week 1 = days 0-6, Week 2 = days 7-13, etc.
+        if week_nums.isna().any():
+            week_nums = week_nums.fillna(self.config.PLANNING_WEEKS // 2)
+        return week_nums.astype('int64').tolist()
 
 
 class ComprehensiveParameterBuilder:
@@ -832,67 +846,84 @@ class ComprehensiveParameterBuilder:
         print("="*80)
         
         params = {}
-        
-        for _, row in self.part_master.iterrows():
-            part = str(row.get('FG Code', '')).strip()
+
+        # Convert each Part Master column once; parts then pick their values by position
+        part_codes = [code.strip() for code in self._text_column('FG Code', '')]
+        unit_weight = self._float_column('Standard unit wt.')
+        bunch_weight = self._float_column('Bunch Wt.')
+        box_quantity = self._int_column('Box Quantity')
+        box_size = self._text_column('Box Size', 'Unknown')
+        moulding_line = self._text_column('Moulding Line', 'Unknown')
+        casting_cycle = self._float_column('Casting Cycle time (min)')
+        casting_batch = self._int_column('Casting Batch Qty')
+        core_cycle = self._float_column('Core Cycle time (min)')
+        core_batch = self._int_column('Core Batch Qty')
+        grind_cycle = self._float_column('Grinding Cycle time (min)')
+        grind_batch = self._int_column('Grinding batch Qty')
+        shakeout_time = self._float_column('Shakeout Time (hrs)')
+        cooling_time = self._float_column('Cooling Time (hrs)')
+        vacuum_time_hrs = self._float_column('Vacuum Time (hrs)')
+        special_coat = self._int_column('Special Coat', missing=0)
+        top_coat = self._int_column('Top Coat', missing=0)
+
+        # ✅ FIXED: Machining and painting stages (separate resources, cycles, dry times, batches),
+        # one [stage 1, stage 2, stage 3] list per part
+        def per_stage(columns):
+            return [list(stage_values) for stage_values in zip(*columns)]
+
+        mach_resources = per_stage(self._text_column(f'Machining resource code {i}', '') for i in range(1, 4))
+        mach_cycles = per_stage(self._float_column(f'Machining Cycle time {i} (min)') for i in range(1, 4))
+        mach_batches = per_stage(self._int_column(f'Machining batch Qty {i}') for i in range(1, 4))
+        paint_resources = per_stage(self._text_column(f'Painting Resource code {i}', '') for i in range(1, 4))
+        paint_cycles = per_stage(self._float_column(f'Painting Cycle time {i} (min)') for i in range(1, 4))
+        paint_dry_times = per_stage(self._float_column(f'Painting Dry time {i} (hrs)') for i in range(1, 4))
+        paint_batches = per_stage(self._int_column(f'Painting batch Qty {i}') for i in range(1, 4))
+
+        # ✅ CRITICAL FIX: Routing flags for stage-skipping logic
+        has_grinding = self._resource_flags('Grinding Resource code')
+        has_mc1 = self._resource_flags('Machining resource code 1')
+        has_mc2 = self._resource_flags('Machining resource code 2')
+        has_mc3 = self._resource_flags('Machining resource code 3')
+        has_sp1 = self._resource_flags('Painting Resource code 1')
+        has_sp2 = self._resource_flags('Painting Resource code 2')
+        has_sp3 = self._resource_flags('Painting Resource code 3')
+
+        for idx, part in enumerate(part_codes):
             if not part or part == 'nan':
                 continue
             
             params[part] = {
-                'unit_weight': self._safe_float(row.get('Standard unit wt.', 0)),
-                'bunch_weight': self._safe_float(row.get('Bunch Wt.', 0)),
-                'box_quantity': self._safe_int(row.get('Box Quantity', 1)),
-                'box_size': str(row.get('Box Size', 'Unknown')),
-                'moulding_line': str(row.get('Moulding Line', 'Unknown')),
-
-                'casting_cycle': self._safe_float(row.get('Casting Cycle time (min)', 0)),
-                'casting_batch': self._safe_int(row.get('Casting Batch Qty', 1)),
+                'unit_weight': unit_weight[idx],
+                'bunch_weight': bunch_weight[idx],
+                'box_quantity': box_quantity[idx],
+                'box_size': box_size[idx],
+                'moulding_line': moulding_line[idx],
+
+                'casting_cycle': casting_cycle[idx],
+                'casting_batch': casting_batch[idx],
                 
-                'core_cycle': self._safe_float(row.get('Core Cycle time (min)', 0)),
-                'core_batch': self._safe_int(row.get('Core Batch Qty', 1)),
+                'core_cycle': core_cycle[idx],
+                'core_batch': core_batch[idx],
                 
-                'grind_cycle': self._safe_float(row.get('Grinding Cycle time (min)', 0)),
-                'grind_batch': self._safe_int(row.get('Grinding batch Qty', 1)),
+                'grind_cycle': grind_cycle[idx],
+                'grind_batch': grind_batch[idx],
                 
-                'shakeout_time': self._safe_float(row.get('Shakeout Time (hrs)', 0)),
-                'cooling_time': self._safe_float(row.get('Cooling Time (hrs)', 0)),
+                'shakeout_time': shakeout_time[idx],
+                'cooling_time': cooling_time[idx],
                 
-                'vacuum_time_hrs': self._safe_float(row.get('Vacuum Time (hrs)', 0)),
+                'vacuum_time_hrs': vacuum_time_hrs[idx],
                 
-                # ✅ FIXED: Machining stages (separate resources, cycles, batches)
-                'mach_resources': [
-                    str(row.get(f'Machining resource code {i}', ''))
-                    for i in range(1, 4)
-                ],
-                'mach_cycles': [
-                    self._safe_float(row.get(f'Machining Cycle time {i} (min)', 0))
-                    for i in range(1, 4)
-                ],
-                'mach_batches': [
-                    self._safe_int(row.get(f'Machining batch Qty {i}', 1))
-                    for i in range(1, 4)
-                ],
+                'mach_resources': mach_resources[idx],
+                'mach_cycles': mach_cycles[idx],
+                'mach_batches': mach_batches[idx],
                 
-                # ✅ FIXED: Painting stages (separate resources, cycles, dry times, batches)
-                'paint_resources': [
-                    str(row.get(f'Painting Resource code {i}', ''))
-                    for i in range(1, 4)
-                ],
-                'paint_cycles': [
-                    self._safe_float(row.get(f'Painting Cycle time {i} (min)', 0))
-                    for i in range(1, 4)
-                ],
-                'paint_dry_times': [
-                    self._safe_float(row.get(f'Painting Dry time {i} (hrs)', 0))
-                    for i in range(1, 4)
-                ],
-                'paint_batches': [
-                    self._safe_int(row.get(f'Painting batch Qty {i}', 1))
-                    for i in range(1, 4)
-                ],
+                'paint_resources': paint_resources[idx],
+                'paint_cycles': paint_cycles[idx],
+                'paint_dry_times': paint_dry_times[idx],
+                'paint_batches': paint_batches[idx],
                 
-                'special_coat': self._safe_int(row.get('Special Coat', 0)),
-                'top_coat': self._safe_int(row.get('Top Coat', 0))
+                'special_coat': special_coat[idx],
+                'top_coat': top_coat[idx]
             }
             
             params[part]['is_primer'] = (
@@ -902,14 +933,13 @@ class ComprehensiveParameterBuilder:
             params[part]['requires_vacuum'] = params[part]['vacuum_time_hrs'] > 0
             params[part]['lead_time_weeks'] = self._calculate_lead_time(params[part])
 
-            # ✅ CRITICAL FIX: Add routing flags for stage-skipping logic
-            params[part]['has_grinding'] = self._has_resource(row, 'Grinding Resource code')
-            params[part]['has_mc1'] = self._has_resource(row, 'Machining resource code 1')
-            params[part]['has_mc2'] = self._has_resource(row, 'Machining resource code 2')
-            params[part]['has_mc3'] = self._has_resource(row, 'Machining resource code 3')
-            params[part]['has_sp1'] = self._has_resource(row, 'Painting Resource code 1')
-            params[part]['has_sp2'] = self._has_resource(row, 'Painting Resource code 2')
-            params[part]['has_sp3'] = self._has_resource(row, 'Painting Resource code 3')
+            params[part]['has_grinding'] = has_grinding[idx]
+            params[part]['has_mc1'] = has_mc1[idx]
+            params[part]['has_mc2'] = has_mc2[idx]
+            params[part]['has_mc3'] = has_mc3[idx]
+            params[part]['has_sp1'] = has_sp1[idx]
+            params[part]['has_sp2'] = has_sp2[idx]
+            params[part]['has_sp3'] = has_sp3[idx]
         
         print(f"✓ {len(params)} parts configured with stage-by-stage details")
         
@@ -961,28 +991,41 @@ class ComprehensiveParameterBuilder:
         # This allows: cast(W) → grind(W+1) → machine(W+2) → paint(W+2) → deliver(W+3)
         return max(self.config.MIN_LEAD_TIME_WEEKS, cooling_shakeout_weeks + 2 + lags)
     
-    def _safe_float(self, value):
-        try:
-            return float(value) if pd.notna(value) else 0.0
-        except Exception:
-            return 0.0
-    
-    def _safe_int(self, value):
-        try:
-            return int(value) if pd.notna(value) else 1
-        except Exception:
-            return 1
-
-    def _has_resource(self, row, col_name):
-        """✅ CRITICAL FIX: Check if part has a resource for this stage (routing awareness)"""
-        val = row.get(col_name)
-        if pd.isna(val):
-            return False
-        if isinstance(val, (int, float)) and val == 0:
-            return False
-        if isinstance(val, str) and val.strip() in ('0', '', 'nan', 'NaN'):
-            return False
-        return True
+    def _numeric_column(self, col_name, missing, invalid):
+        """Part Master column as a float array: `missing` if the column is absent, `invalid` for blank or non-numeric cells"""
+        if col_name not in self.part_master.columns:
+            return np.full(len(self.part_master), missing, dtype=float)
+        values = pd.to_numeric(self.part_master[col_name], errors='coerce').to_numpy(dtype=float)
+        return np.where(np.isnan(values), invalid, values)
+
+    def _float_column(self, col_name):
+        """Part Master column as floats (0.0 when absent, blank or non-numeric)"""
+        return self._numeric_column(col_name, 0.0, 0.0).tolist()
+
+    def _int_column(self, col_name, missing=1):
+        """Part Master column as truncated ints (1 when blank or non-numeric, `missing` when absent)"""
+        values = self._numeric_column(col_name, missing, 1)
+        values[np.isinf(values)] = 1
+        return values.astype('int64').tolist()
+
+    def _text_column(self, col_name, missing):
+        """Part Master column as strings (`missing` when absent)"""
+        if col_name not in self.part_master.columns:
+            return [missing] * len(self.part_master)
+        return self.part_master[col_name].astype(str).tolist()
+
+    def _resource_flags(self, col_name):
+        """✅ CRITICAL FIX: Per-part flags - does the part have a resource for this stage (routing awareness)
+
+        Blank cells, zeros and '0'/'nan' text mean no resource; a missing column means none for every part.
+        """
+        if col_name not in self.part_master.columns:
+            return [False] * len(self.part_master)
+        values = self.part_master[col_name]
+        no_resource = (values.isna()
+                       | pd.to_numeric(values, errors='coerce').eq(0)
+                       | values.astype(str).str.strip().isin(['0', '', 'nan', 'NaN']))
+        return (~no_resource).tolist()
 
 
 class MachineResourceManager:
@@ -1180,12 +1223,7 @@ class ComprehensiveOptimizationModel:
         print("SOLVING COMPREHENSIVE MODEL")
         print("="*80)
 
-        solver = PULP_CBC_CMD(
-            timeLimit=120,  # Increased from 120 to 300 seconds for better WIP utilization
-            threads=8,
-            msg=1
-        )
-        status = self.model.solve(solver)
+        status = self.model.solve(self._create_solver())
         
         print(f"\nStatus: {pulp.LpStatus[status]}")
         if status in (pulp.LpStatusOptimal, pulp.LpStatusNotSolved):
@@ -1195,6 +1233,15 @@ class ComprehensiveOptimizationModel:
                 pass
         
         return status
+
+    def _create_solver(self):
+        """CBC solver configured from the solver settings in config"""
+        return PULP_CBC_CMD(
+            timeLimit=self.config.SOLVER_TIME_LIMIT,
+            threads=self.config.SOLVER_THREADS,
+            gapRel=self.config.SOLVER_GAP_REL,
+            msg=1
+        )
     
     def _create_variables(self):
         print("\n✓ Creating variables with stage separation...")
@@ -1280,10 +1327,13 @@ class ComprehensiveOptimizationModel:
                 else:
                     self.x_sp3[(variant, w)] = 0  # Part skips SP3
                 
-                delivery_ub = demand_up if window_start <= w <= window_end else 0
-                self.x_delivery[(variant, w)] = pulp.LpVariable(
-                    f"deliver_{variant}_W{w}", lowBound=0, upBound=delivery_ub, cat='Continuous'
-                )
+                # Deliveries only happen inside the variant's delivery window
+                if window_start <= w <= window_end:
+                    self.x_delivery[(variant, w)] = pulp.LpVariable(
+                        f"deliver_{variant}_W{w}", lowBound=0, upBound=demand_up, cat='Continuous'
+                    )
+                else:
+                    self.x_delivery[(variant, w)] = 0  # Outside the delivery window
         
         for variant in self.split_demand:
             self.unmet_demand[variant] = pulp.LpVariable(
@@ -2882,8 +2932,11 @@ def main():
     loader = ComprehensiveDataLoader(file_path, config)
     data = loader.load_all_data()
     
+    # Build WIP init (shared by the demand calculation and the model)
+    wip_init = build_wip_init(data['stage_wip'])
+
     # Calculate demand with stage-wise skip logic
-    calculator = WIPDemandCalculator(data['sales_order'], data['stage_wip'], config)
+    calculator = WIPDemandCalculator(data['sales_order'], data['stage_wip'], config, wip_init)
     (net_demand, stage_start_qty, wip_coverage, 
      gross_demand, wip_by_part) = calculator.calculate_net_demand_with_stages()
     split_demand, part_week_mapping, variant_windows = calculator.split_demand_by_week(net_demand)
@@ -2896,9 +2949,6 @@ def main():
     machine_manager = MachineResourceManager(data['machine_constraints'], config)
     box_manager = BoxCapacityManager(data['box_capacity'], config, machine_manager)
     
-    # Build WIP init
-    wip_init = build_wip_init(data['stage_wip'])
-    
     # ✅ Build and solve COMPREHENSIVE model
     optimizer = ComprehensiveOptimizationModel(
         split_demand,
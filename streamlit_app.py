@@ -276,7 +276,8 @@ def run_optimization_with_progress(uploaded_file, config, progress_callback=None
         # Stage 2: Calculate demand (15-30%)
         update_progress(20, "Calculating net demand with WIP adjustments...")
         try:
-            calculator = WIPDemandCalculator(data['sales_order'], data['stage_wip'], config)
+            wip_init = build_wip_init(data['stage_wip'])
+            calculator = WIPDemandCalculator(data['sales_order'], data['stage_wip'], config, wip_init)
             (net_demand, stage_start_qty, wip_coverage,
              gross_demand, wip_by_part) = calculator.calculate_net_demand_with_stages()
             split_demand, part_week_mapping, variant_windows = calculator.split_demand_by_week(net_demand)
@@ -314,7 +315,6 @@ def run_optimization_with_progress(uploaded_file, config, progress_callback=None
         try:
             machine_manager = MachineResourceManager(data['machine_constraints'], config)
             box_manager = BoxCapacityManager(data['box_capacity'], config, machine_manager)
-            wip_init = build_wip_init(data['stage_wip'])
         except Exception as e:
             raise OptimizationError(
                 f"Failed to setup resources: {str(e)}",